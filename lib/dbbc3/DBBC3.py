@@ -27,10 +27,19 @@ from dbbc3.DBBC3Config import DBBC3Config
 from dbbc3.DBBC3Commandset import DBBC3Commandset
 from dbbc3.DBBC3Exception import DBBC3Exception
 import socket
+import threading
 import atexit
 import re
 import sys
-from time import sleep
+from time import sleep, monotonic
+
+# MAC address with optional ':' or '-' separators (e.g. ba:dc:af:e4:be:e2)
+_MAC_RE = re.compile(r"[0-9a-f]{2}([-:]?)[0-9a-f]{2}(\1[0-9a-f]{2}){4}", re.IGNORECASE)
+
+# maximum number of cached query responses (see DBBC3.sendCommand)
+_CACHE_SIZE = 64
+# size of the chunks in which the responses are received (see DBBC3.sendCommand)
+_RECV_SIZE = 2048
 
 class DBBC3(object):
         ''' 
@@ -51,12 +60,17 @@ class DBBC3(object):
             mode (str, optional): the expected mode of the DBBC3 (see note above)
             majorVersion (int, optional): the expected major version of the DBBC3 control software (see note above)
             timeout (int, optional): the timeout in seconds to set for the socket communication to the DBBC3 (default: None)
+            cacheTTL (float, optional): the time in seconds for which responses to read-only queries are cached (default: 0 = no caching)
         '''
         
         dataFormats = ["vdif","raw"]    # valid output data formats
     
         core3hModes = ["independent","half_merged", "merged", "pfb"] # valid core3h modes
 
+        # sets of the above for the validation of arguments
+        _dataFormatSet = frozenset(dataFormats)
+        _core3hModeSet = frozenset(core3hModes)
+
         @property 
         def config (self):
             ''' :py:class:`DBBC3Config`: the dbbc3 configuration '''
@@ -77,7 +91,7 @@ class DBBC3(object):
             'int: the socket timeout in seconds'''
             return (self._timeout)
 
-        def __init__(self, host, port=4000,  mode=None, majorVersion=None, timeout=None):
+        def __init__(self, host, port=4000,  mode=None, majorVersion=None, timeout=None, cacheTTL=0):
             ''' 
             The constructor
 
@@ -85,6 +99,30 @@ class DBBC3(object):
 
             self.socket = None
 
+            # serializes the access to the socket (see sendCommand)
+            self._lock = threading.Lock()
+
+            # reusable buffer for assembling the outgoing commands
+            self._cmdBuf = bytearray(256)
+            # reusable buffers for receiving and assembling the responses
+            self._recvBuf = memoryview(bytearray(_RECV_SIZE))
+            self._respBuf = bytearray()
+
+            # cache for the responses of read-only queries (see sendCommand)
+            self._cacheTTL = cacheTTL
+            self._responseCache = {}
+
+            # results of the board conversions keyed by (board, numCoreBoards)
+            self._boardDigitCache = {}
+
+            # synthesizer source last selected by the synth methods keyed by the synthesizer number
+            # (cleared on connect and whenever the source might have been changed otherwise, see sendCommand)
+            self._synthSource = {}
+
+            # parsed core3h version and device information keyed by the board number
+            # (cleared when the board is reset, rebooted or reconfigured)
+            self._core3hInfoCache = {}
+
             self._connect(host,port, timeout)
 
             # attach basic command set
@@ -131,9 +169,16 @@ class DBBC3(object):
             Raises:
                 DBBC3Exception: in case the connection could not be established
             '''
+            # the synthesizer sources might have been changed while not connected
+            self._synthSource.clear()
+
             try:
                 
                 self.socket = socket.create_connection((host, port), 5)
+                # commands are short request / response exchanges; send them without delay
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # the connection is kept open for the lifetime of the object; detect dead peers
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
                 # DBBC3 socket issue: will establish formal connection without 
                 # raising a timeout exception  even if
@@ -162,15 +207,26 @@ class DBBC3(object):
                     self.socket = None
 
 
-        def sendCommand(self, command):
+        def sendCommand(self, command, cache=False):
             '''
             Method for sending generic commands to the DBBC3
 
             Note:
                 the response of the last sendCommand is always available through the lastResponse class property
 
+            Note:
+                if the cache parameter is set and caching has been enabled (see cacheTTL parameter of the constructor)
+                the response of a previous identical command is returned without contacting the DBBC3 as long as it
+                is not older than cacheTTL seconds. Any command sent without the cache parameter clears the cache.
+                Only set cache for read-only queries.
+
+            Note:
+                sendCommand can be called from several threads. The commands are serialized as the DBBC3 control
+                software processes one command at a time on a single connection.
+
             Args:
-                command (str): the command to the DBBC3 control software server
+                command (str or bytes-like): the command to the DBBC3 control software server
+                cache (boolean, optional): if True the response may be served from / stored in the cache (default: False)
 
             Returns:
                 str: the response received from the DBBC3 control software
@@ -180,26 +236,62 @@ class DBBC3(object):
             
             '''
 
-            rv = -1
-            try:
-                rv = self.socket.send((command + "\0").encode())
-                self._lastCommand = command
-                self._lastResponse = ""
-
-                while True:
-                    part = self.socket.recv(2048)
-                    if not part or len(part) < 2048:
-                        break
-                    self._lastResponse += part.decode('utf-8')
-                self._lastResponse += part.decode('utf-8')
-
-            except Exception as e:
-                raise DBBC3Exception("An error in the communication has occured")
-
-            if rv <= 0:
-                raise DBBC3Exception("An error in the communication has occured" )
+            if isinstance(command, str):
+                cmdBytes = command.encode()
+            else:
+                cmdBytes = command
+                command = bytes(command).decode()
+
+            # the command / response exchange must not be interleaved with other threads
+            with self._lock:
+
+                if cache and self._cacheTTL > 0:
+                    entry = self._responseCache.get(command)
+                    if entry and monotonic() - entry[0] < self._cacheTTL:
+                        self._lastCommand = command
+                        self._lastResponse = entry[1]
+                        return(entry[1])
+                else:
+                    # command might change the state of the DBBC3
+                    self._responseCache.clear()
+                    if command.startswith("synth") and ("source" in command or command.startswith("synthinit")):
+                        # source selection not done by _selectSynthSource or reinitialization of the synthesizers
+                        self._synthSource.clear()
+
+                response = ""
+                try:
+                    # assemble the null-terminated command in the reusable buffer
+                    size = len(cmdBytes) + 1
+                    if size > len(self._cmdBuf):
+                        self._cmdBuf = bytearray(size)
+                    self._cmdBuf[:size-1] = cmdBytes
+                    self._cmdBuf[size-1] = 0
+
+                    # sendall makes sure the complete command is transmitted
+                    self.socket.sendall(memoryview(self._cmdBuf)[:size])
+                    self._lastCommand = command
+                    self._lastResponse = ""
+
+                    respBuf = self._respBuf
+                    del respBuf[:]
+                    while True:
+                        numBytes = self.socket.recv_into(self._recvBuf, _RECV_SIZE)
+                        respBuf += self._recvBuf[:numBytes]
+                        if numBytes < _RECV_SIZE:
+                            break
+                    response = respBuf.decode('utf-8')
+                    self._lastResponse = response
+
+                except Exception as e:
+                    raise DBBC3Exception("An error in the communication has occured")
+
+                if cache and self._cacheTTL > 0:
+                    if len(self._responseCache) >= _CACHE_SIZE:
+                        # drop the oldest entry
+                        del self._responseCache[next(iter(self._responseCache))]
+                    self._responseCache[command] = (monotonic(), response)
             
-            return(self._lastResponse)
+            return(response)
 
 
         def _validateVersion(self, retVersion, mode, majorVersion):
@@ -214,11 +306,11 @@ class DBBC3(object):
 
 
         def _validateMAC(self, mac):
-            if not re.match("[0-9a-f]{2}([-:]?)[0-9a-f]{2}(\\1[0-9a-f]{2}){4}$", mac.lower()):
+            if not _MAC_RE.fullmatch(mac):
                 raise ValueError("Invalid MAC address %s" % (mac))
 
         def _validateDataFormat(self, form):
-            if form not in DBBC3.dataFormats:
+            if form not in DBBC3._dataFormatSet:
                 raise ValueError("Invalid data format requested %s. Must be one of %s" % (form, DBBC3.dataFormats))
 
         def _validateCore3hMode(self, mode):
@@ -229,7 +321,7 @@ class DBBC3(object):
                 ValueError: in case the specified core3h mode is invalid
             '''
             
-            if mode not in DBBC3.core3hModes:
+            if mode not in DBBC3._core3hModeSet:
                 raise ValueError("envalid Core3H mode %s. Must be one of %s" %(mode, DBBC3.core3hModes))
 
         def _validateSamplerNum (self, sampler):
@@ -239,14 +331,20 @@ class DBBC3(object):
             Raises:
                 ValueError: in case the specified sampler number is invalid
             '''
+            numSamplers = self.config.numSamplers
+
+            # fast path for the common case of a valid sampler number
+            if type(sampler) is int and 0 <= sampler <= numSamplers:
+                return
+
             if not isinstance(sampler, int):
                 raise ValueError("Sampler number must be an integer.")
 
             if sampler < 0:
                 raise ValueError("Sampler number must be >0.")
 
-            if sampler > self.config.numSamplers:
-                raise ValueError("Sampler number must be in the range: 0-%d" % (self.config.numSamplers))
+            if sampler > numSamplers:
+                raise ValueError("Sampler number must be in the range: 0-%d" % (numSamplers))
 
         def _valueToHex(self, value):
 
@@ -267,9 +365,14 @@ class DBBC3(object):
             Raises:
                 ValueError: in case the specified bbc number is invalid
             '''
+            maxTotalBBCs = self.config.maxTotalBBCs
 
-            if bbc not in range(1, self.config.maxTotalBBCs+1):
-                raise ValueError("BBC must be in the range 1-%d" % (self.config.maxTotalBBCs))
+            # fast path for the common case of a valid bbc number
+            if type(bbc) is int and 0 < bbc <= maxTotalBBCs:
+                return
+
+            if bbc not in range(1, maxTotalBBCs+1):
+                raise ValueError("BBC must be in the range 1-%d" % (maxTotalBBCs))
 
         def _validateBBCFreq(self, freq):
             ''' 
@@ -371,18 +474,12 @@ class DBBC3(object):
             Returns:
                 char: the core board identifier as uppercase char e.g. A
             '''
-            board = (str(board)).upper()
+            numCoreBoards = self.config.numCoreBoards
+            # fast path for the common case of a valid board number
+            if type(board) is int and 0 <= board < numCoreBoards:
+                return(self.config.coreBoards[board])
 
-            # if board was given as number fetch the correct board letter
-            if board.isdigit():
-                if ((int(board) < 0) or (int(board) > self.config.numCoreBoards)):
-                    raise ValueError("Core board must be within %s" % (self.config.coreBoards))
-                board = self.config.coreBoards[int(board)]
-            elif board.isalpha():
-                if board not in (self.config.coreBoards):
-                    raise ValueError("Core board must be within %s" % (self.config.coreBoards))
-
-            return(board)
+            return(self.config.coreBoards[self.boardToDigit(board)])
 
         def boardToDigit(self, board):
             '''
@@ -393,6 +490,16 @@ class DBBC3(object):
             Returns:
                 int: the core board identifier as integer (starting at 0 for board A)
             '''
+            numCoreBoards = self.config.numCoreBoards
+            # fast path for the common case of a valid board number
+            if type(board) is int and 0 <= board < numCoreBoards:
+                return(board)
+
+            key = (board, numCoreBoards)
+            boardDigit = self._boardDigitCache.get(key)
+            if boardDigit is not None:
+                return(boardDigit)
+
             board = (str(board)).upper()
 
             # if board was given as number fetch the correct board letter
@@ -404,7 +511,10 @@ class DBBC3(object):
                 if board not in (self.config.coreBoards):
                     raise ValueError("Core board must be within %s" % (self.config.coreBoards))
                 board = ord(board) - 65
+            else:
+                raise ValueError("Core board must be within %s" % (self.config.coreBoards))
 
+            self._boardDigitCache[key] = board
             return(board)
                 
 
@@ -28,12 +28,274 @@ import dbbc3.DBBC3Util as d3u
 import types 
 import re
 import time
-import importlib
 import inspect
 import sys
+import functools
 from datetime import datetime
 from dbbc3.DBBC3Exception import DBBC3Exception
 
+# valid IF labels accepted by the dbbc command
+_VALID_IF_LABELS = frozenset("abcdefgh")
+
+# response text of the core3h core3_mode command (following "data from") and the corresponding mode
+_CORE3_MODES = {
+    "all samplers is merged": "merged",
+    "two samplers is merged": "half_merged",
+    "each sampler is sent to a different output": "independent",
+    "pfb": "pfb",
+}
+_CORE3_MODE_RE = re.compile(r"data from (%s)" % "|".join(map(re.escape, _CORE3_MODES)))
+
+# precompiled patterns for parsing the DBBC3 responses
+#P("11") = 9.64% (6171370)
+_BSTAT_RE = re.compile(r'^\s*P\("(\d\d)"\)\s*=\s*(\d+\.\d+)%\s+\((\d+)\)', re.MULTILINE)
+#Power at sampler 0 = 65053929
+_POWER_RE = re.compile(r"^\s*Power\s+at\s+[Ss]ampler\s+(\d)\s+=\s+(\d+)", re.MULTILINE)
+# dbbcgain/ 1,83,74,agc,15000; or dbbcgain/ 1,83,74,man;
+_DBBCGAIN_RE = re.compile(r"^dbbcgain\/\s+(.+?),(\d+),(\d+),(\w+)(?:,(\d+))?;", re.MULTILINE)
+# dbbcstat/ 16,S,34.67,34.53;
+_DBBCSTAT_RE = re.compile(r"dbbcstat\/\s+(\d+),([SM]),(\d+\.\d+),(\d+\.\d+);")
+#TP[2][0] = 69948
+_DSC_TP_RE = re.compile(r"^TP\[(\d+)\]\[[0123]\]\s+=\s+(\d+)", re.MULTILINE)
+# [11] =   1454,   9%
+_DSC_BSTAT_RE = re.compile(r"\[(\d\d)\]\s*=\s*(\d+),\s*(\d+)\%")
+# index of the 2-bit states in the list returned by dsc_bstat
+_BSTAT_IDX = {"11": 0, "10": 1, "01": 2, "00": 3}
+# 0-1: 186075933 (core3_corr) or [0-1]: 157322344 (dsc_corr); the pair may be preceded by a label
+_CORR_RE = re.compile(r"\[?(\d-\d)\]?:[ \t]*(\d+)")
+# index of the sampler pairs in the list returned by the correlation methods
+_CORR_PAIRS = {"0-1": 0, "1-2": 1, "2-3": 2}
+# System name : FiLa10GS4+
+_CORE3H_VERSION_RE = re.compile(r"^[ \t]*(System name|Compiled on|SW version|HW version)[^:\n]*:(.*)$", re.MULTILINE)
+# labels of the core3h version response and the corresponding keys of the returned dictionary
+_CORE3H_VERSION_KEYS = {
+    "System name": "systemName",
+    "Compiled on": "compileDate",
+    "SW version": "versionSW",
+    "HW version": "versionHW",
+}
+# <address range> -> <device name>
+_DEVICES_RE = re.compile(r"^[ \t]*(\S+?)[ \t]*->[ \t]*(\S+)[ \t\r]*$", re.MULTILINE)
+# core3hread/ Core3H[1],Block[1],BBC[5000],Reg[1] = 00000077;
+_CORE3HREAD_RE = re.compile(r"^core3hread/.+?\s*=\s*([0-9A-Fa-f]+);", re.MULTILINE)
+# version/ DDC_V,124,February 18th 2020;
+_VERSION_RE = re.compile(r"version\/\s+(.+),(\d+),(.+?\s+.+?\s+\d{4});?")
+# line of the time response: key = value, FiLa10G (end of board entry) or 2019-01-30T13:32:08
+_TIME_LINE_RE = re.compile(r"^[ \t]*(?:([^=\n]*)=([^=\n]*)|(.*FiLa10G.*)|(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}))[ \t\r]*$", re.MULTILINE)
+# 2019-02-21T15:09:21 (line of the core3h time response)
+_CORE3H_TIME_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\s*$", re.MULTILINE)
+# adb3linit/ Samplers initialized;
+_ADB3LINIT_RE = re.compile(r"^adb3linit\/\s*Samplers initialized;", re.MULTILINE)
+# core3hinit/ Core3H initialized;
+_CORE3HINIT_RE = re.compile(r"^core3hinit\/\s*Core3H initialized;", re.MULTILINE)
+# synthinit/ Synthesizers configured;
+_SYNTHINIT_RE = re.compile(r"^synthinit\/\s*Synthesizers configured;", re.MULTILINE)
+# threshold=ON (enablecal)
+_ENABLECAL_RE = re.compile(r"^\s*(threshold|gain|offset)\s*=\s*(\S+)", re.MULTILINE | re.IGNORECASE)
+# S1 locked / S2 not locked
+_SYNTH_LOCK_RE = re.compile(r"^S([1-4]) (not )?locked", re.MULTILINE)
+# 0xBFBFBFBF / 0b10111111101111111011111110111111 / -1077952577
+_REGREAD_RE = re.compile(r"^\s*((?:0x)?[0-9A-Fa-f]+)\s*/\s*((?:0b)?[01]+)\s*/\s*([-+]?\d+)\s*$", re.MULTILINE)
+# F 4524 MHz; // Act 4524 MHz
+_SYNTH_CW_RE = re.compile(r"F\s+(\d+(?:\.\d+)?)\s+MHz;\s*//\s*Act\s+(\d+(?:\.\d+)?)\s+MHz")
+# OEN 1;
+_OEN_RE = re.compile(r"^[ \t]*OEN\s+(\d)\s*;", re.MULTILINE)
+# ATT 30.0; // dB
+_ATT_RE = re.compile(r"^[ \t]*ATT\s+(\d+\.\d+)\s*;", re.MULTILINE)
+# VSI sample rate : 1280000 Hz / 2
+_VSI_SAMPLERATE_RE = re.compile(r"^.*VSI sample rate.*:[ \t]+(\d+)[ \t]+Hz[ \t]?\/?[ \t]?(\d)?", re.MULTILINE)
+# VSI input bitmask : 0xFFFFFFFF 0xFFFFFFFF
+_VSI_BITMASK_RE = re.compile(r"^[ \t]*VSI input bitmask[ \t]*:((?:[ \t]*0x[A-F0-9]{8})+)", re.MULTILINE)
+# vsi1: VSI input 2
+_VSI_SWAP_RE = re.compile(r"\s*vsi(\d+):\s+VSI\s+input\s+(\d+)")
+# Input selected: tvg
+_INPUTSELECT_RE = re.compile(r"^[ \t]*Input selected:[ \t]*(.*?)\r?$", re.MULTILINE)
+# channel width (in bits)        : 2
+# => number of frames per second : 27 (16bit@54000Hz)
+_VDIF_FRAME_RE = re.compile(r"^[^:\n]*?(channel width|number of channels|payload size|frame size|number of frames per second|number of data threads|number of frames per thread)[^:\n]*:[ \t]*(\d+)", re.MULTILINE)
+# keys of the vdif_frame response dictionary by label
+_VDIF_FRAME_KEYS = {
+    "channel width": "channelWidth",
+    "number of channels": "numChannels",
+    "payload size": "payloadSize",
+    "frame size": "frameSize",
+    "number of frames per second": "framesPerSecond",
+    "number of data threads": "numThreads",
+    "number of frames per thread": "framesPerThreads",
+}
+# VDIF station ID : 'NA'
+_VDIF_STATION_RE = re.compile(r"VDIF station ID[^:\n]*:(.*)")
+# 0x00000000 (field of the vdif_userdata response)
+_USERDATA_RE = re.compile(r"^\s*(0x.*?)\s*$", re.MULTILINE)
+# line of the destination response:
+# Output 1 destination: 192.168.1.3:46227, Output 1 destination: none or Data thread [0] -> 192.168.1.3:46227
+_DESTINATION_LINE_RE = re.compile(r"^[ \t]*(?:Output\s+(\d+)\s+destination:\s+(?:(\d+\.\d+\.\d+\.\d+):(\d+)|none)|Data thread\s+\[(\d+)\]\s+->\s+(\d+\.\d+\.\d+\.\d+):(\d+))", re.MULTILINE)
+# BA:DC:AF:E4:BE:E2 192.168.1.0 (arp cache entry of core3h_tengbinfo)
+_TENGBINFO_ARP_RE = re.compile(r"^[ \t]+(..:..:..:..:..:..)[ \t]+(\d+\.\d+\.\d+\.\d+)", re.MULTILINE)
+# ARP requests: off (during data transfer)
+_ARP_RE = re.compile(r"^[ \t]+ARP requests:[ \t]+(.*)", re.MULTILINE)
+# key/value line of the sysstat response e.g. Selected input      : vsi1
+_SYSSTAT_LINE_RE = re.compile(r"^[ \t]*([^:\n]*):(.*)$", re.MULTILINE)
+# Output 0 format selected: vdif
+_FORMAT_SELECTED_RE = re.compile(r"^[ \t]+Output\s+(\d)\s+format selected:[ \t]+(.*?)\s*$", re.MULTILINE)
+# power at sampler 0 = 108690709 (lowercased)
+_SAMPLER_POWER_VALUE_RE = re.compile(r"^[ \t]*power\s+at\s+sampler\s+\d\s+=[ \t]*(\d+)", re.MULTILINE)
+# offset at sampler 0 = 62536837 (lowercased)
+_SAMPLER_OFFSET_VALUE_RE = re.compile(r"^[ \t]*offset\s+at\s+sampler\s+\d\s+=[ \t]*(\d+)", re.MULTILINE)
+# samplers 0-1: 186075933 (lowercased)
+_SAMPLER_DELAY_VALUE_RE = re.compile(r"^[ \t]*samplers\s+\d\-\d:[ \t]*(\d+)", re.MULTILINE)
+# Past leap seconds within reference epoch: 1
+_LEAPSECS_RE = re.compile(r"^.*epoch:[ \t]*(-*\d+)", re.MULTILINE)
+# Board[1]: Epoch: 47, Second: 11801730
+_BOARD_EPOCH_RE = re.compile(r"^[ \t]*Board\[(\d)\][ \t]*:[ \t]*Epoch:[ \t]*(\d+),[ \t]*Second:[ \t]*(\d+)", re.MULTILINE)
+# dbbctp0/ all,10;
+_DBBCTP0_RE = re.compile(r"^dbbctp0\/[ \t]*(.+?),(\d+);", re.MULTILINE)
+# dbbctdiode/ all,20,30;
+_DBBCTDIODE_RE = re.compile(r"^dbbctdiode\/[ \t]*(.+?),(\d+),(\d+);", re.MULTILINE)
+# dbbcdpfu/ all,20,30;
+_DBBCDPFU_RE = re.compile(r"^dbbcdpfu\/[ \t]*(.+?),(\d+),(\d+);", re.MULTILINE)
+# cont_cal/ off,0,80,0;
+_CONT_CAL_RE = re.compile(r"^cont_cal\/[ \t]+(.+?),(\d),(\d+),(\d);", re.MULTILINE)
+# mag_thr/ 1,75.000000;
+_MAG_THR_RE = re.compile(r"^mag_thr\/[ \t]*(\d+),(\d+\.\d+)", re.MULTILINE)
+# Offset at sampler 0 = 64143398
+_SAMPLER_OFFSET_RE = re.compile(r"^[ \t]*Offset\s+at\s+sampler\s+(\d)[ \t]*=[ \t]*(\d+)", re.MULTILINE)
+# Power at sampler 0 = 106424473
+_SAMPLER_POWER_RE = re.compile(r"^[ \t]*Power\s+at\s+sampler\s+(\d)[ \t]*=[ \t]*(\d+)", re.MULTILINE)
+# Power at filter 0a = 62066749
+_FILTER_POWER_RE = re.compile(r"^[ \t]*Power\s+at\s+filter\s+([01][ab])[ \t]+=[ \t]+(\d+)", re.MULTILINE)
+# Board[1], Filter 1 has file "[c:/DBBC_CONF/OCT_D_120/2000-4000_64taps.flt]" loaded
+_TAP_FILE_RE = re.compile(r'^.*Filter[ \t]+(\d+)[ \t]+has[ \t]+file[ \t]+"\[(.+)\]"[ \t]+loaded', re.MULTILINE)
+# sections of the samplerstats response e.g. Sampler 0: 108690709[OK]
+_SAMPLERSTATS_RE = {
+    "power": re.compile(r"\s*Sampler\s*(\d)\s*:\s*(\d+)\[(.*)\]"),
+    "offset": re.compile(r"\s*Sampler\s*(\d)\s*:\s*(\d+)\s+(\d+\.\d+)\%\[(.*)\]"),
+    "delay": re.compile(r"\s*Sampler\s*(\d\-\d)\s*:\s*(\d+)\[(.*)\]"),
+}
+# sections of the core3hstats response e.g. Filter 1: 62066749
+_CORE3HSTATS_RE = {
+    "power": re.compile(r"\s*Filter\s*(\d)\s*:\s*(\d+)"),
+    "bstat": re.compile(r"\s*(\d{2})\s*:\s*(\d+)\s+(\d+\.\d+)\%"),
+}
+
+@functools.lru_cache(maxsize=16)
+def _ppsDelayPattern(boardNum, numVals):
+    '''
+    Returns the compiled pattern matching a complete pps_delay response.
+
+    The patterns are cached so that every variant is compiled only once per process.
+
+    Args:
+        boardNum (int): the board number (starting at 1) of a board specific query; None for the query of all boards
+        numVals (int): the number of delay entries contained in the response
+
+    Returns:
+        re.Pattern: the compiled pattern
+    '''
+
+    #pps_delay/ [1]: 39 ns, [2] 39 ns, [3] 0 ns, [4] 0 ns, [5] 0 ns, [6] 0 ns, [7] 0 ns, [8] 0 ns;
+    # pps_delay[1]/ [1]: 43 ns, [5] 43 ns;
+    patStr = r"^pps_delay/" if boardNum is None else r"^pps_delay\[%d\]/" % boardNum
+    patStr += r"\s+\[(\d+)\]:?\s+(\d+)\s+ns," * numVals
+    return re.compile(patStr[:-1] + ";", re.MULTILINE)
+
+@functools.lru_cache(maxsize=16)
+def _dbbcifPattern(board):
+    '''
+    Returns the compiled pattern matching the dbbcif response of the given board.
+
+    Args:
+        board (str): the board ID in lower case (e.g. "a")
+
+    Returns:
+        re.Pattern: the compiled pattern
+    '''
+
+    # dbbcifa/ 2,32,agc,2,32000,32000
+    return re.compile(r"dbbcif%s/\s(\d),(\d+),(.+),(\d),(\d+),(\d+)" % (board))
+
+@functools.lru_cache(maxsize=128)
+def _dbbcPattern(bbc):
+    '''
+    Returns the compiled pattern matching the dbbc response of the given BBC.
+
+    Args:
+        bbc (int): the BBC number (starting at 1)
+
+    Returns:
+        re.Pattern: the compiled pattern
+    '''
+
+    #  dbbc001/ 2992.000000,a,32,1,agc,142,123,14855,14753,14866,14749;
+    return re.compile(r"^dbbc%03d\/[ \t]*(\d+\.\d+),(.?),(\d+),(\d+),(.+?),(\d+),(\d+),(\d+),(\d+),(\d+),(\d+);" % (bbc), re.MULTILINE)
+
+@functools.lru_cache(maxsize=16)
+def _dbbctpPattern(board):
+    '''
+    Returns the compiled pattern matching the dbbctp response of the given board.
+
+    Args:
+        board (str): the board ID in lower case (e.g. "a")
+
+    Returns:
+        re.Pattern: the compiled pattern
+    '''
+
+    #dbbctpd/ 0, 0, 0;
+    return re.compile(r"^dbbctp%s\/[ \t]*(\d+),[ \t]*(\d+),[ \t]*(\d+);" % (board), re.MULTILINE)
+
+@functools.lru_cache(maxsize=128)
+def _labelToKey(label, numUnderscores):
+    '''
+    Converts a label of a key/value response (e.g. tengbinfo, sysstat) into the key used in the returned dictionary.
+
+    Whitespace is collapsed, the first numUnderscores spaces are replaced by underscores, dots are removed
+    and the result is made lower case e.g. "IP address" becomes "ip_address"
+
+    Args:
+        label (str): the label as contained in the response
+        numUnderscores (int): the maximum number of spaces to replace by underscores
+
+    Returns:
+        str: the dictionary key
+    '''
+
+    return (' '.join(label.split())).replace(" ", "_", numUnderscores).replace(".","").lower()
+
+@functools.lru_cache(maxsize=64)
+def _methodFunctions(csClass, names):
+    '''
+    Resolves the methods with the given names of a command set class.
+
+    The result is cached as the command set classes of this module do not change at runtime.
+
+    Args:
+        csClass (type): the command set class
+        names (tuple of str): the method names
+
+    Returns:
+        tuple: (name, function) pairs in the order of names
+    '''
+
+    return tuple((name, getattr(csClass, name)) for name in names)
+
+def _selectSynthSource(dbbc, synthNum, sourceNum):
+    '''
+    Selects the source (output) of the given synthesizer addressed by subsequent synth commands
+
+    The source select command is only sent if the source differs from the one last selected
+    through this function (see DBBC3.sendCommand for the invalidation of the remembered sources).
+
+    Args:
+        dbbc (DBBC3): the DBBC3 instance
+        synthNum (int): the synthesizer number (starting at 1)
+        sourceNum (int): the source number (1 or 2)
+    '''
+
+    if dbbc._synthSource.get(synthNum) != sourceNum:
+        dbbc.sendCommand("synth=%d,source %d" % (synthNum, sourceNum))
+        dbbc._synthSource[synthNum] = sourceNum
+
 def getMatchingCommandset(mode, majorVersion):
     '''
     Determines the command set sub-class to be used for the given mode and major version.
@@ -51,6 +313,23 @@ def getMatchingCommandset(mode, majorVersion):
 
     '''
 
+    ret = _findCommandset(mode, majorVersion)
+    if ret:
+        print ("Selecting commandset version: %s" % ret)
+
+    return(ret)
+
+@functools.lru_cache(maxsize=64)
+def _findCommandset(mode, majorVersion):
+    '''
+    Implementation of :py:func:`getMatchingCommandset`.
+
+    The result is cached as the command set classes of this module do not change at runtime.
+
+    Returns:
+        str: The class name that implements the command set for the given mode and major version ("" if none was found)
+    '''
+
     # parse all class names of this module
     current_module = sys.modules[__name__]
 
@@ -81,10 +360,7 @@ def getMatchingCommandset(mode, majorVersion):
             else:
                 break
 
-    ret = "DBBC3Commandset_%s_%s" % (mode,pickVer)
-    print ("Selecting commandset version: %s" % ret)
-
-    return(ret)
+    return("DBBC3Commandset_%s_%s" % (mode,pickVer))
 
 class DBBC3Commandset(object):
     '''
@@ -101,6 +377,8 @@ class DBBC3Commandset(object):
 
     '''
 
+    __slots__ = ()
+
     def __init__(self,clas, version=None):
         
 
@@ -117,9 +395,21 @@ class DBBC3Commandset(object):
         if (csClassName == ""):
             csClassName = "DBBC3CommandsetDefault"
 
-        CsClass = getattr(importlib.import_module("dbbc3.DBBC3Commandset"), csClassName)
+        CsClass = getattr(sys.modules[__name__], csClassName)
         CsClass(clas)
 
+    def _attachMethods(self, clas, names):
+        '''
+        Attaches the methods of this command set with the given names to the DBBC3 instance
+
+        Args:
+            clas (object): the class instance to which to attach the methods
+            names (tuple of str): the names of the methods to attach
+        '''
+
+        for name, func in _methodFunctions(type(self), names):
+            # binds the plain function to the DBBC3 instance (same as types.MethodType)
+            setattr(clas, name, func.__get__(clas))
     
 
 class DBBC3CommandsetDefault(DBBC3Commandset):
@@ -132,78 +422,35 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
     e.g. DBBC3Commandset_OCT_D_110
     '''
 
+    __slots__ = ()
+
+    # methods attached to the DBBC3 instance in all modes
+    _METHOD_NAMES = (
+        "version", "dbbcif", "enableloop", "disableloop", "enablecal",
+        "synthFreq", "synthLock", "synthOen", "synthAtt",
+        "checkphase", "time", "reconfigure",
+#        "cal_offset", "cal_gain", "cal_delay",
+        "adb3linit", "core3hinit", "synthinit",
+#        "core3hstats",
+
+        "core3h_version", "core3h_sysstat", "core3h_sysstat_fs", "core3h_mode_fs", "core3h_status_fs",
+        "core3h_devices", "core3h_regread", "core3h_regread_dec", "core3h_regwrite", "core3h_regupdate",
+        "core3h_core3_bstat", "core3h_core3_power", "core3h_core3_corr", "core3h_core3_mode", "core3h_core3_init",
+        "core3h_reboot", "core3h_reset", "core3h_output", "core3h_start", "core3h_stop",
+        "core3h_arp", "core3h_tengbarp", "core3h_tengbinfo", "core3h_tengbcfg", "core3h_destination",
+        "core3h_vdif_userdata", "_getVdifUserdata", "core3h_vdif_station", "core3h_vdif_frame", "core3h_vdif_enc",
+        "core3h_timesync", "core3h_time", "core3h_tvg_mode", "core3h_splitmode", "core3h_inputselect",
+#        "core3h_vsi_swap",
+        "core3h_vsi_bitmask", "core3h_vsi_samplerate",
+
+        "adb3l_reset", "adb3l_reseth", "adb3l_resets",
+#        "adb3l_biston", "adb3l_bistoff", "adb3l_SDA_on",
+        "adb3l_delay", "adb3l_offset", "adb3l_gain",
+    )
+
     def __init__(self, clas):
 
-        clas.version = types.MethodType (self.version.__func__, clas)
-        #clas.dbbcif = types.MethodType (self.dbbcif.__func__, clas)
-        #clas.enableloop = types.MethodType (self.enableloop.__func__, clas)
-        clas.dbbcif = types.MethodType (self.dbbcif.__func__, clas)
-        clas.enableloop = types.MethodType (self.enableloop.__func__, clas)
-        clas.disableloop = types.MethodType (self.disableloop.__func__, clas)
-        clas.enablecal = types.MethodType (self.enablecal.__func__, clas)
-        clas.synthFreq = types.MethodType (self.synthFreq.__func__, clas)
-        clas.synthLock = types.MethodType (self.synthLock.__func__, clas)
-        clas.synthOen = types.MethodType (self.synthOen.__func__, clas)
-        clas.synthAtt = types.MethodType (self.synthAtt.__func__, clas)
-        clas.checkphase = types.MethodType (self.checkphase.__func__, clas)
-        clas.time = types.MethodType (self.time.__func__, clas)
-        clas.reconfigure = types.MethodType (self.reconfigure.__func__, clas)
-        #clas.cal_offset = types.MethodType (self.cal_offset.__func__, clas)
-        #clas.cal_gain = types.MethodType (self.cal_offset.__func__, clas)
-        #clas.cal_delay = types.MethodType (self.cal_offset.__func__, clas)
-        clas.adb3linit = types.MethodType (self.adb3linit.__func__, clas)
-        clas.core3hinit = types.MethodType (self.core3hinit.__func__, clas)
-        clas.synthinit = types.MethodType (self.synthinit.__func__, clas)
-        #clas.core3hstats = types.MethodType (self.core3hstats.__func__, clas)
-
-        clas.core3h_version = types.MethodType (self.core3h_version.__func__, clas)
-        clas.core3h_sysstat = types.MethodType (self.core3h_sysstat.__func__, clas)
-        clas.core3h_sysstat_fs = types.MethodType (self.core3h_sysstat_fs.__func__, clas)
-        clas.core3h_mode_fs = types.MethodType (self.core3h_mode_fs.__func__, clas)
-        clas.core3h_status_fs = types.MethodType (self.core3h_status_fs.__func__, clas)
-        clas.core3h_devices = types.MethodType (self.core3h_devices.__func__, clas)
-        clas.core3h_regread = types.MethodType (self.core3h_regread.__func__, clas)
-        clas.core3h_regread_dec = types.MethodType (self.core3h_regread_dec.__func__, clas)
-        clas.core3h_regwrite = types.MethodType (self.core3h_regwrite.__func__, clas)
-        clas.core3h_regupdate = types.MethodType (self.core3h_regupdate.__func__, clas)
-        clas.core3h_core3_bstat = types.MethodType (self.core3h_core3_bstat.__func__, clas)
-        clas.core3h_core3_power = types.MethodType (self.core3h_core3_power.__func__, clas)
-        clas.core3h_core3_corr = types.MethodType (self.core3h_core3_corr.__func__, clas)
-        clas.core3h_core3_mode = types.MethodType (self.core3h_core3_mode.__func__, clas)
-        clas.core3h_core3_init = types.MethodType (self.core3h_core3_init.__func__, clas)
-        clas.core3h_reboot = types.MethodType (self.core3h_reboot.__func__, clas)
-        clas.core3h_reset = types.MethodType (self.core3h_reset.__func__, clas)
-        clas.core3h_output = types.MethodType (self.core3h_output.__func__, clas)
-        clas.core3h_start = types.MethodType (self.core3h_start.__func__, clas)
-        clas.core3h_stop = types.MethodType (self.core3h_stop.__func__, clas)
-        clas.core3h_arp = types.MethodType (self.core3h_arp.__func__, clas)
-        clas.core3h_tengbarp = types.MethodType (self.core3h_tengbarp.__func__, clas)
-        clas.core3h_tengbinfo = types.MethodType (self.core3h_tengbinfo.__func__, clas)
-        clas.core3h_tengbcfg = types.MethodType (self.core3h_tengbcfg.__func__, clas)
-        clas.core3h_destination = types.MethodType (self.core3h_destination.__func__, clas)
-        clas.core3h_vdif_userdata = types.MethodType (self.core3h_vdif_userdata.__func__, clas)
-        clas._getVdifUserdata = types.MethodType (self._getVdifUserdata.__func__, clas)
-        clas.core3h_vdif_station = types.MethodType (self.core3h_vdif_station.__func__, clas)
-        clas.core3h_vdif_frame = types.MethodType (self.core3h_vdif_frame.__func__, clas)
-        clas.core3h_vdif_enc = types.MethodType (self.core3h_vdif_enc.__func__, clas)
-        clas.core3h_timesync = types.MethodType (self.core3h_timesync.__func__, clas)
-        clas.core3h_time = types.MethodType (self.core3h_time.__func__, clas)
-        clas.core3h_tvg_mode = types.MethodType (self.core3h_tvg_mode.__func__, clas)
-        clas.core3h_splitmode = types.MethodType (self.core3h_splitmode.__func__, clas)
-        clas.core3h_inputselect = types.MethodType (self.core3h_inputselect.__func__, clas)
-#       clas.core3h_vsi_swap = types.MethodType (self.core3h_vsi_swap.__func__, clas)
-        clas.core3h_vsi_bitmask = types.MethodType (self.core3h_vsi_bitmask.__func__, clas)
-        clas.core3h_vsi_samplerate = types.MethodType (self.core3h_vsi_samplerate.__func__, clas)
-
-        clas.adb3l_reset = types.MethodType (self.adb3l_reset.__func__, clas)
-        clas.adb3l_reseth = types.MethodType (self.adb3l_reseth.__func__, clas)
-        clas.adb3l_resets = types.MethodType (self.adb3l_resets.__func__, clas)
-#        clas.adb3l_biston = types.MethodType (self.adb3l_biston.__func__, clas)
-#        clas.adb3l_bistoff = types.MethodType (self.adb3l_bistoff.__func__, clas)
-#        clas.adb3l_SDA_on = types.MethodType (self.adb3l_SDA_on.__func__, clas)
-        clas.adb3l_delay = types.MethodType (self.adb3l_delay.__func__, clas)
-        clas.adb3l_offset = types.MethodType (self.adb3l_offset.__func__, clas)
-        clas.adb3l_gain = types.MethodType (self.adb3l_gain.__func__, clas)
+        self._attachMethods(clas, DBBC3CommandsetDefault._METHOD_NAMES)
 
 
 # GENERAL DBBC3 commands
@@ -225,12 +472,12 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         # version/ OCT_D,110,July 03 2019
         # version/ DDC_V,124,February 18th 2020;
         # version/ DSC,110, January 20th 2020
-        pattern = re.compile("version\/\s+(.+),(\d+),(.+?\s+.+?\s+\d{4});{0,1}")
+        pattern = _VERSION_RE
 
         match = pattern.match(ret)
         if match:
             # remove any st/nd/rd/th from the date string
-            amended = re.sub('\d+(st|nd|rd|th)', lambda m: m.group()[:-2].zfill(2), match.group(3).strip())
+            amended = d3u.stripOrdinals(match.group(3).strip())
             resp["mode"] = match.group(1)
             resp["majorVersion"] =  int(match.group(2))
             resp["minorVersion"] = int(datetime.strptime(amended, '%B %d %Y').strftime('%y%m%d'))
@@ -264,29 +511,23 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         resp = []
         ret = self.sendCommand("time")
 
-        lines = ret.split("\n")
         entry = {}
-        for line in lines:
-            line = line.strip()
-            tok = line.split("=")
-            if len(tok) == 2:
-                value = tok[1].strip()
+        for match in _TIME_LINE_RE.finditer(ret):
+            key, value, board, timestamp = match.groups()
+            if key is not None:
+                value = value.strip()
                 if (value.isdigit()):
                     value = int(value)
-                entry[tok[0].strip()] = value
-            elif "FiLa10G" in line: # new board entry
+                entry[key.strip()] = value
+            elif board is not None: # new board entry
                 if not entry:
                     raise DBBC3Exception("time: did not receive any time information for a board")
                 resp.append(entry)
                 entry =  {}
             else:
                 # 2019-01-30T13:32:08
-                try:
-                    dateTime = time.strptime(line,"%Y-%m-%dT%H:%M:%S")
-                    entry["timestamp"] = dateTime
-                    entry["timestampAsString"] = line
-                except:
-                    continue
+                entry["timestamp"] = time.strptime(timestamp,"%Y-%m-%dT%H:%M:%S")
+                entry["timestampAsString"] = timestamp
                 
         if not resp:
             raise DBBC3Exception("time: Did not receive any time information")
@@ -350,7 +591,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         ret = self.sendCommand(cmd)
 
-        pattern = re.compile("dbbcif%s/\s(\d),(\d+),(.+),(\d),(\d+),(\d+)"%(board))
+        pattern = _dbbcifPattern(board)
 
         match = pattern.match(ret)
         if match:
@@ -375,6 +616,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
 
         self.sendCommand("reconfigure")
+        self._core3hInfoCache.clear()
 
     def adb3linit(self):
         '''
@@ -388,14 +630,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         ret = self.sendCommand("adb3linit")
 
         # adb3linit/ Samplers initialized;
-        pattern = re.compile("adb3linit\/\s*Samplers initialized;")
-
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                return(True)
-
-        return (False) 
+        return (_ADB3LINIT_RE.search(ret) is not None)
 
     def core3hinit(self, board=None):
         '''
@@ -419,14 +654,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         ret = self.sendCommand(cmd)
 
         #  core3hinit/ Core3H initialized;
-        pattern = re.compile("core3hinit\/\s*Core3H initialized;")
-
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                return(True)
-
-        return (False)
+        return (_CORE3HINIT_RE.search(ret) is not None)
 
     def synthinit(self):
         '''
@@ -440,14 +668,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         ret = self.sendCommand("synthinit")
 
         #  synthinit/ Synthesizers configured;
-        pattern = re.compile("synthinit\/\s*Synthesizers configured;")
-
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                return(True)
-
-        return (False) 
+        return (_SYNTHINIT_RE.search(ret) is not None)
 
         
 #    def cal_offset(self, board):
@@ -506,30 +727,15 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         board = self.boardToDigit(board)
 
-        synthNum = int(board / 2) +1
+        synthNum = board // 2 + 1
         sourceNum = board % 2 + 1
 
         locked = [-1,-1,-1,-1]
         ret = self.sendCommand("synth=%d,lock" % synthNum)
 
-        lines = ret.split("\n")
-        for line in lines:
-                if line.startswith("S1 not locked"):
-                        locked[0]=False
-                elif line.startswith("S1 locked"):
-                        locked[0]=True
-                if line.startswith("S2 not locked"):
-                        locked[1]=False
-                elif line.startswith("S2 locked"):
-                        locked[1]=True
-                if line.startswith("S3 not locked"):
-                        locked[2]=False
-                elif line.startswith("S3 locked"):
-                        locked[2]=True
-                if line.startswith("S4 not locked"):
-                        locked[3]=False
-                elif line.startswith("S4 locked"):
-                        locked[3]=True
+        # S1 locked / S2 not locked
+        for match in _SYNTH_LOCK_RE.finditer(ret):
+            locked[int(match.group(1))-1] = match.group(2) is None
         if (locked[sourceNum-1] == -1):
             raise DBBC3Exception("Cannot determine synthesizer lock state of board %d" % (board))
 
@@ -562,11 +768,11 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         # board B is served by synth 1 source 2
         # board C is served by synth 2 source 1
         # etc.
-        synthNum = int(boardNum / 2) +1
+        synthNum = boardNum // 2 + 1
         sourceNum = boardNum % 2 + 1
 
         # first enable the source of the given synthesizer corresponding to the selected board
-        self.sendCommand("synth=%d,source %d" % (synthNum, sourceNum))
+        _selectSynthSource(self, synthNum, sourceNum)
         cmd = "synth=%d,cw " % synthNum
 
         if freq is not None:
@@ -575,14 +781,11 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         ret = self.sendCommand(cmd)
 
-        lines = ret.split("\n")
         # output: ['cw\r', 'F 4524 MHz; // Act 4524 MHz\r', '\r-2->']
-        for line in lines:
-                if "MHz" in line:
-                        # F 4524 MHz; // Act 4524 MHz
-                        tok = line.split(" ")
-                        resp['target'] = float(tok[1]) * 2
-                        resp['actual'] = float(tok[5]) * 2
+        match = _SYNTH_CW_RE.search(ret)
+        if match:
+            resp['target'] = float(match.group(1)) * 2
+            resp['actual'] = float(match.group(2)) * 2
         if not resp:
             raise DBBC3Exception("The synthesizer frequency for board %d could not be determined" % (board))
 
@@ -611,11 +814,10 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
 
         #print ("state: ", state)
-        resp = {}
         boardNum = self.boardToDigit(board)
 
         # determine synthesizer and output for the given board
-        synthNum = int(boardNum / 2) +1
+        synthNum = boardNum // 2 + 1
         sourceNum = boardNum % 2 + 1
 
         cmd = "synth=%d,oen" % (synthNum)
@@ -628,15 +830,13 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
                 cmd += " 0"
 
         # first enable the source of the given synthesizer corresponding to the selected board
-        self.sendCommand("synth=%d,source %d" % (synthNum, sourceNum))
+        _selectSynthSource(self, synthNum, sourceNum)
         ret = self.sendCommand(cmd)
 
-        pattern = re.compile("\s*OEN\s+(\d)\s*;")
         # OEN 1;
-        for line in ret.split("\n"):
-                match =  pattern.match(line)
-                if match:
-                    return(match.group(1))
+        match = _OEN_RE.search(ret)
+        if match:
+            return(match.group(1))
 
         return(None)
 
@@ -653,15 +853,14 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
             
         '''
 
-        resp = {}
         boardNum = self.boardToDigit(board)
 
         # determine synthesizer and output for the given board
-        synthNum = int(boardNum / 2) +1
+        synthNum = boardNum // 2 + 1
         sourceNum = boardNum % 2 + 1
 
         # first enable the source of the given synthesizer corresponding to the selected board
-        self.sendCommand("synth=%d,source %d" % (synthNum, sourceNum))
+        _selectSynthSource(self, synthNum, sourceNum)
 
         cmd = "synth=%d,att" % (synthNum)
 
@@ -669,11 +868,9 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         # ATT 30.0; // dB
         # -2->;
-        pattern = re.compile("\s*ATT\s+(\d+\.\d+)\s*;")
-        for line in ret.split("\n"):
-                match =  pattern.match(line)
-                if match:
-                    return(match.group(1))
+        match = _ATT_RE.search(ret)
+        if match:
+            return(match.group(1))
 
         return (None)
 
@@ -729,15 +926,8 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         gain = gain.lower()
         offset = offset.lower()
 
-        resp = {}
         ret = self.sendCommand("enablecal=%s,%s,%s" % (threshold,gain,offset))
-        for line in ret.split("\n"):
-            line = line.strip()
-            try:
-                (key,val) = line.split("=")
-                resp[key] = val.lower()
-            except:
-                pass
+        resp = {match.group(1).lower(): match.group(2).lower() for match in _ENABLECAL_RE.finditer(ret)}
         
         if not resp:
             raise DBBC3Exception("enablecal: the settings for the calibration loop could not be determined")
@@ -779,11 +969,9 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         ret = self.sendCommand("core3h=%d,regread %s %d" % (boardNum, device, regNum))
 
         # 0xBFBFBFBF / 0b10111111101111111011111110111111 / -1077952577
-        lines = ret.split("\n")
-        for line in lines:
-            fields = line.split("/")
-            if len(fields) == 3:
-                return hex(int(fields[0], 16)), bin(int(fields[1],2)), int(fields[2])
+        match = _REGREAD_RE.search(ret)
+        if match:
+            return hex(int(match.group(1), 16)), bin(int(match.group(2),2)), int(match.group(3))
 
     def core3h_regread_dec(self, board, regNum, device="core3"):
         '''
@@ -805,7 +993,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         boardNum = self.boardToDigit(board) +1
 
         ret = self.sendCommand("core3h=%d,regread_dec %s %d" % (boardNum, device, regNum))
-        lines = ret.split("\n")
+        lines = ret.splitlines()
 
         return int(lines[2].strip())
 
@@ -833,7 +1021,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         try:
             hexVal = self._valueToHex(value)
-        except:
+        except (ValueError, TypeError):
             raise ValueError("core3h_regwrite: register value not in hexadecimal format")
 
         ret = self.sendCommand("core3h=%d,regwrite %s %d %s" % (boardNum, device, regNum, hexVal))
@@ -869,12 +1057,12 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         try:
             hexVal = self._valueToHex(value)
-        except:
+        except (ValueError, TypeError):
             raise ValueError("core3h_regupdate: register value not in hexadecimal format")
 
         try:
             hexBitmask = self._valueToHex(bitmask)
-        except:
+        except (ValueError, TypeError):
             raise ValueError("core3h_regupdate: bitmask not in hexadecimal format")
 
         ret = self.sendCommand("core3h=%d,regupdate %s %d %s %s" % (boardNum, device, regNum, hexVal, hexBitmask))
@@ -888,16 +1076,10 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,vdif_userdata" % (boardNum)
+        cmd = f"core3h={boardNum},vdif_userdata"
         ret = self.sendCommand(cmd)
 
-        userdata = []
-        for line in ret.split("\n"):
-            line = line.strip()
-            if line.startswith("0x"):
-                userdata.append(line)
-
-        return(userdata)
+        return(_USERDATA_RE.findall(ret))
         
     def core3h_vsi_samplerate(self, board, sampleRate=None, decimation=1):
         '''
@@ -927,28 +1109,25 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,vsi_samplerate" % (boardNum)
+        cmd = f"core3h={boardNum},vsi_samplerate"
         if sampleRate:
             cmd += " %d %d" % (sampleRate, decimation)
 
-        ret = self.sendCommand(cmd)
+        ret = self.sendCommand(cmd, cache=(not sampleRate))
 
         if "Failed" in ret:
             raise DBBC3Exception("core3h_vsi_samplerate: Error setting vsi_samplerate (check lastResponse)" )
 
         response = {} 
-        pattern = re.compile(".*:\s+(\d+)\s+Hz\s?\/?\s?(\d)?")
         #VSI sample rate : 64000000 Hz
         #VSI sample rate : 1280000 Hz / 2
-        for line in ret.split("\n"):
-            if "VSI sample rate" in line:
-                match =  pattern.match(line)
-                if match:
-                    if not match.group(2):
-                        response["decimation"] = 1
-                    else:
-                        response["decimation"] = int(match.group(2))
-                    response["sampleRate"] = int(match.group(1))
+        match = _VSI_SAMPLERATE_RE.search(ret)
+        if match:
+            if not match.group(2):
+                response["decimation"] = 1
+            else:
+                response["decimation"] = int(match.group(2))
+            response["sampleRate"] = int(match.group(1))
 
         return(response)
 
@@ -989,20 +1168,17 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 #            if (int(valStr, 16) > 0xffffffff):
 #                raise ValueError("core3h_vdif_bitmask: the supplied mask is longer than 32 bit")
 #    
-        cmd = "core3h=%d,vsi_bitmask" % (boardNum)
-        ret = self.sendCommand(cmd)
+        cmd = f"core3h={boardNum},vsi_bitmask"
+        ret = self.sendCommand(cmd, cache=True)
 
         response = ""
         #VSI input bitmask : 0xFFFFFFFF 0xFFFFFFFF
-        pattern = re.compile("\s*VSI input bitmask\s*:\s*(0x[A-F0-9]{8}).*")
 #        if "Failed" in ret:
 #            raise ValueError("core3h_inputselect: Illegal source supplied: %s" % (source))
 
-        for line in ret.split("\n"):
-            #line = " VSI input bitmask : 0x89ABCDEF"
-            match = pattern.match(line)
-            if match:
-                response = match.group(1).split()
+        match = _VSI_BITMASK_RE.search(ret)
+        if match:
+            response = match.group(1).split()
         
         return(response)
         
@@ -1028,10 +1204,10 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if count == 1 and firstVSI != "reset":
             raise ValueError("core3h_vsi_swap: both VSIs must be specified")
             
-        cmd = "core3h=%d,vsi_swap %s" % (boardNum, vsiStr)
+        cmd = f"core3h={boardNum},vsi_swap {vsiStr}"
         ret = self.sendCommand(cmd)
 
-        pattern = re.compile("\s*vsi(\d+):\s+VSI\s+input\s+(\d+)")
+        pattern = _VSI_SWAP_RE
 
         # vsi1: VSI input 2
         #for line in ret.split("\n"):
@@ -1076,18 +1252,16 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,inputselect %s" % (boardNum, source)
+        cmd = f"core3h={boardNum},inputselect {source}"
         ret = self.sendCommand(cmd)
 
-        # Input selected: tvg
-        pattern = re.compile("\s*Input selected:\s*(.*)")
         if "Failed" in ret:
             raise ValueError("core3h_inputselect: Illegal source supplied: %s" % (source))
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                response = match.group(1)
+        # Input selected: tvg
+        match = _INPUTSELECT_RE.search(ret)
+        if match:
+            response = match.group(1)
 
         return(response)
 
@@ -1134,7 +1308,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if mode not in ["on","off"]:
             raise ValueError("core3h_splitmode: illegal mode supplied: %s" % (mode))
 
-        cmd = "core3h=%d,splitmode %s" % (boardNum, mode)
+        cmd = f"core3h={boardNum},splitmode {mode}"
         ret = self.sendCommand(cmd)
 
         if "Split mode: off" in ret:
@@ -1175,8 +1349,8 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if mode:
             modeStr = mode.strip()
 
-        cmd = "core3h=%d,tvg_mode %s" % (boardNum, modeStr)
-        ret = self.sendCommand(cmd)
+        cmd = f"core3h={boardNum},tvg_mode {modeStr}"
+        ret = self.sendCommand(cmd, cache=(not modeStr))
         
         if "Failed" in ret:
             raise ValueError("core3h_tvg_mode: illegal TVG mode supplied: %s" % (mode))
@@ -1206,18 +1380,13 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,time" % (boardNum)
+        cmd = f"core3h={boardNum},time"
         ret = self.sendCommand(cmd)
 
         timestamp = None
-        # 2019-02-21T15:09:21
-        for line in ret.split("\n"):
-                try:
-                        line = line.strip()
-                        timestamp = datetime.strptime(line,"%Y-%m-%dT%H:%M:%S")
-                        break
-                except ValueError:
-                        continue
+        match = _CORE3H_TIME_RE.search(ret)
+        if match:
+            timestamp = datetime.fromisoformat(match.group(1))
 
         return(timestamp)
 
@@ -1238,7 +1407,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,timesync" % (boardNum)
+        cmd = f"core3h={boardNum},timesync"
 
         if (timestamp):
             cmd += " " + datetime.strftime(timestamp, '%Y-%m-%dT%H:%M:%S')
@@ -1246,7 +1415,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         ret = self.sendCommand(cmd)
 
-        lines = ret.split("\n")
+        lines = ret.splitlines()
         entry = {}
         #halfYearsSince2000 = 38
         #seconds = 3920060
@@ -1312,7 +1481,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,vdif_frame" % (boardNum)
+        cmd = f"core3h={boardNum},vdif_frame"
         
         if channelWidth:
             cmd += " %d" % (int(channelWidth))
@@ -1336,28 +1505,9 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         # => number of data threads      : 1
         # => number of frames per thread : 27 (16bit@54000Hz)
         response = {}
-        response["compatible"] = True
-        for line in ret.split("\n"):
-
-            if "WARNING: current frame setup is not compatible with selected input!" in line:
-                response["compatible"] = False
-
-            tok = line.split(":")
-            if len(tok) == 2:
-                if "channel width" in tok[0]:
-                    response["channelWidth"] = int(tok[1])
-                elif "number of channels" in tok[0]:
-                    response["numChannels"] = int(tok[1])
-                elif "payload size" in tok[0]:
-                    response["payloadSize"] = int(tok[1])
-                elif "frame size" in tok[0]:
-                    response["frameSize"] = int(tok[1])
-                elif "number of frames per second" in tok[0]:
-                    response["framesPerSecond"] = int(tok[1].strip().split(" ")[0])
-                elif "number of data threads" in tok[0]:
-                    response["numThreads"] = int(tok[1])
-                elif "number of frames per thread" in tok[0]:
-                    response["framesPerThreads"] = int(tok[1].strip().split(" ")[0])
+        response["compatible"] = "WARNING: current frame setup is not compatible with selected input!" not in ret
+        for match in _VDIF_FRAME_RE.finditer(ret):
+            response[_VDIF_FRAME_KEYS[match.group(1)]] = int(match.group(2))
                     
         return(response)
 
@@ -1389,18 +1539,18 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         code = "unknown"
 
-        cmd = "core3h=%d,vdif_station" % (boardNum)
+        cmd = f"core3h={boardNum},vdif_station"
         if stationId is not None:
             if len(stationId) > 2:
                 raise ValueError("core3h_vdif_station: stationId must be two-letter code")
             cmd += " " + stationId
             
-        ret = self.sendCommand(cmd)
+        ret = self.sendCommand(cmd, cache=(stationId is None))
 
         #VDIF station ID : 'NA'
-        for line in ret.split("\n"):
-            if "VDIF station ID" in line:
-                code = line.split(":")[1].replace("'","").strip()
+        match = _VDIF_STATION_RE.search(ret)
+        if match:
+            code = match.group(1).replace("'","").strip()
 
         return(code)
 
@@ -1423,8 +1573,8 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,vdif_enc" % (boardNum)
-        ret = self.sendCommand(cmd)
+        cmd = f"core3h={boardNum},vdif_enc"
+        ret = self.sendCommand(cmd, cache=True)
 
         if "on" in ret:
             return("on")
@@ -1462,18 +1612,17 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         # first obtain current user data field contents
         current = self._getVdifUserdata(board)
         
-        values = ""
-        for i in range(4):
-            x = eval("d"+str(i))
+        values = []
+        for i, x in enumerate((d0, d1, d2, d3)):
             if x:
                 valStr = self._valueToHex(x)
                 if (int(valStr, 16) > 0xffffffff):
                     raise ValueError("core3h_vdif_userdata: value exceeds 32 bit length")
-                values += " " + valStr
+                values.append(valStr)
             else:
-                values += " " + current[i]
+                values.append(current[i])
 
-        cmd = "core3h=%d,vdif_userdata %s" % (boardNum, values)
+        cmd = f"core3h={boardNum},vdif_userdata {' '.join(values)}"
         ret = self.sendCommand(cmd)
 
         userdata = self._getVdifUserdata(board)
@@ -1521,44 +1670,32 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         #setter part
         if ip is None:
-            cmd = "core3h=%d,destination %s none %s" % (boardNum, outputId, threadStr)
+            cmd = f"core3h={boardNum},destination {outputId} none {threadStr}"
             ret = self.sendCommand(cmd)
         elif ip != "":
-            cmd = "core3h=%d,destination %s %s:%s %s" % (boardNum, outputId, ip, port, threadStr)
+            cmd = f"core3h={boardNum},destination {outputId} {ip}:{port} {threadStr}"
             ret = self.sendCommand(cmd)
 
         #getter part (always executed even after setting destination
-        cmd = "core3h=%d,destination %s" % (boardNum, outputId)
+        cmd = f"core3h={boardNum},destination {outputId}"
         ret = self.sendCommand(cmd)
 
         #Output 1 destination: 192.168.1.3:46227
-        pat1 = re.compile("\s*Output\s+(\d+)\s+destination:\s+(\d+\.\d+\.\d+\.\d+):(\d+)")
-
         #Output 1 destination: none
-        pat2 = re.compile("\s*Output\s+(\d+)\s+destination:\s+none")
-        #pat2 = re.compile("\s*Output\s+(\d+):\s+destination of data thread (\d+) rewritten to (\d+\.\d+\.\d+\.\d+):(\d+)")
-
         #Data thread [0] -> 192.168.1.100:46338
-        pat3 = re.compile("\s*Data thread\s+\[(\d+)\]\s+->\s+(\d+\.\d+\.\d+\.\d+):(\d+)")
-        
         entry = {}
-        for line in ret.split("\n"):
-            match1 = pat1.match(line) 
-            match2 = pat2.match(line) 
-            match3 = pat3.match(line) 
-            if match1:
-                entry["output"] = match1.group(1)
-                entry["ip"] = match1.group(2)
-                entry["port"] = match1.group(3)
-            elif match2:
-                 entry["output"] = match2.group(1)
-                 entry["ip"] = None
-                 entry["port"] = None
-            elif match3:
+        for match in _DESTINATION_LINE_RE.finditer(ret):
+            output, ip, port, threadNum, threadIp, threadPort = match.groups()
+            if output is not None:
+                # ip and port are None in case the output is disabled
+                entry["output"] = output
+                entry["ip"] = ip
+                entry["port"] = port
+            else:
                 thread = {}
-                thread["ip"] = match3.group(2)
-                thread["port"] = match3.group(3)
-                entry["thread_%s"%(match3.group(1))] = thread
+                thread["ip"] = threadIp
+                thread["port"] = threadPort
+                entry["thread_%s"%(threadNum)] = thread
 
         return(entry)
 
@@ -1578,38 +1715,25 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
 
         response = {} 
-        arpTable = []
         boardNum = self.boardToDigit(board)+1
-        ret = self.sendCommand("core3h=%d,tengbinfo %s " % (boardNum, device))
+        ret = self.sendCommand(f"core3h={boardNum},tengbinfo {device} ")
 
         if "not found" in ret:
             raise ValueError("Unknown ethernet device specified (%s) in call to core3h_tengbinfo." % (device))
 
-        pattern = re.compile("\s+(..:..:..:..:..:..)\s+(\d+\.\d+\.\d+\.\d+)")
-        for line in ret.split("\n"):
-            # first parse normal configuration key/value pairs
-            tok = line.split(":")
-            if len(tok) == 2 or "MAC address" in tok[0]:
-                if "Configuration information" in tok[0]:
+        # first parse normal configuration key/value pairs
+        for line in ret.splitlines():
+            key, sep, value = line.partition(":")
+            if (sep and ":" not in value) or "MAC address" in key:
+                if "Configuration information" in key:
                     continue
 
-                # reformat key; make lower case; replace spaces by underscore; remove .
-                key = (' '.join(tok[0].split())).replace(" ", "_",1).replace(".","").lower()
-                value = ":".join(tok[1:]).strip()
-                response[key] = value
-                continue
-
-            # now parse arp table
-            # MAC               IP
-            # BA:DC:AF:E4:BE:E2 192.168.1.0
-            match = pattern.match(line)
-            if match:
-                entry = {}
-                entry["mac"] = match.group(1)
-                entry["ip"] = match.group(2)
-                arpTable.append(entry)
+                response[_labelToKey(key, 1)] = value.strip()
 
-        response['arp_cache'] = arpTable 
+        # now parse arp table
+        # MAC               IP
+        # BA:DC:AF:E4:BE:E2 192.168.1.0
+        response['arp_cache'] = [{"mac": match.group(1), "ip": match.group(2)} for match in _TENGBINFO_ARP_RE.finditer(ret)]
         return(response)
 
     def core3h_tengbcfg(self, board, device, key, value):
@@ -1633,7 +1757,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,tengbcfg %s %s=%s" % (boardNum, device, str(key), str(value))
+        cmd = f"core3h={boardNum},tengbcfg {device} {key}={value}"
         ret = self.sendCommand(cmd)
 
         return
@@ -1680,22 +1804,20 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         boardNum = self.boardToDigit(board)+1
         
         arpMode = "unknown"
-        cmd = "core3h=%d,arp " % (boardNum)
+        cmd = f"core3h={boardNum},arp "
         if mode:
             if mode not in ["on","off"]:
                 raise ValueError("Illegal arp mode (%s). Must be on or off." % (mode))
             cmd += mode
-        ret = self.sendCommand(cmd)
+        ret = self.sendCommand(cmd, cache=(not mode))
 
         # ARP requests: off (during data transfer)
-        pattern = re.compile("\s+ARP requests:\s+(.*)")
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                if "on" in match.group(1):
-                    arpMode = "on"
-                elif  "off" in match.group(1):
-                    arpMode = "off"
+        match = _ARP_RE.search(ret)
+        if match:
+            if "on" in match.group(1):
+                arpMode = "on"
+            elif  "off" in match.group(1):
+                arpMode = "off"
                 
 
 
@@ -1735,26 +1857,23 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
         boardNum = self.boardToDigit(board)+1
 
-        outFormats = [""] * 4
+        numOutputs = self.config.numCore3hOutputs
+        outFormats = [""] * numOutputs
 
         formats = format.split("+")
-        if len(formats) > self.config._numCore3hOutputs:
-            raise ValueError("Too many output formats specified to core3h_start. Maximum number of outputs is %d" % (self.config._numCore3hOutputs))
+        if len(formats) > numOutputs:
+            raise ValueError("Too many output formats specified to core3h_start. Maximum number of outputs is %d" % (numOutputs))
         for form in formats:
             self._validateDataFormat(form)
 
-        cmd = "core3h=%d,start %s " % (boardNum, format)
+        cmd = f"core3h={boardNum},start {format} "
         if force:
             cmd += "force"
         ret = self.sendCommand(cmd)
         # Output 0 format selected: vdif
         
-        pattern = re.compile("\s+Output\s+(\d)\s+format selected:\s+(.*)")
-
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                outFormats[int(match.group(1))] = match.group(2)
+        for match in _FORMAT_SELECTED_RE.finditer(ret):
+            outFormats[int(match.group(1))] = match.group(2)
 
         return(outFormats)
 
@@ -1772,11 +1891,8 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        ret = self.sendCommand("core3h=%d,stop" % (boardNum))
-        for line in ret.split("\n"):
-            if "Stopped" in line:
-                return(True)
-        return(False)
+        ret = self.sendCommand(f"core3h={boardNum},stop")
+        return("Stopped" in ret)
         
 
     def core3h_output(self, board, outputIdx=0, frameId=0):
@@ -1849,16 +1965,13 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         
         boardNum = self.boardToDigit(board)+1
     
-        cmd = "core3h=%d,reset " %(boardNum)
+        cmd = f"core3h={boardNum},reset "
         if keepsync:
             cmd += "keepsync"
         ret = self.sendCommand(cmd)
+        self._core3hInfoCache.pop(boardNum, None)
 
-        for line in ret.split("\n"):
-            if ("Reset done" in line):
-                return(True)
-
-        return(False)
+        return("Reset done" in ret)
 
     def core3h_reboot(self, board):
         '''
@@ -1879,12 +1992,10 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        ret = self.sendCommand("core3h=%d,reboot" %(boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},reboot")
+        self._core3hInfoCache.pop(boardNum, None)
 
-        for line in ret.split("\n"):
-            if ("not connected" in line):
-                return(False)
-        return(True)
+        return("not connected" not in ret)
 
         
     def core3h_core3_init(self, board):
@@ -1900,14 +2011,12 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,core3_init " % (boardNum)
+        cmd = f"core3h={boardNum},core3_init "
 
         ret = self.sendCommand(cmd)
-        for line in ret.split("\n"):
-            if "Reset done" in line:
-                return(True)
+        self._core3hInfoCache.pop(boardNum, None)
 
-        return(False)
+        return("Reset done" in ret)
 
     def core3h_core3_mode(self, board, mode=None):
         '''
@@ -1927,21 +2036,15 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         retMode = ""
         boardNum = self.boardToDigit(board)+1
 
-        cmd = "core3h=%d,core3_mode " % (boardNum)
+        cmd = f"core3h={boardNum},core3_mode "
         if mode:
             self._validateCore3hMode(mode)
             cmd += mode
         
-        ret = self.sendCommand(cmd)
-        for line in ret.split("\n"):
-            if "data from all samplers is merged" in line:
-                retMode="merged"
-            elif "data from two samplers is merged" in line:
-                retMode="half_merged"
-            elif "data from each sampler is sent to a different output" in line:
-                retMode="independent"
-            elif "data from pfb" in line:
-                retMode="pfb"
+        ret = self.sendCommand(cmd, cache=(not mode))
+        match = _CORE3_MODE_RE.search(ret)
+        if match:
+            retMode = _CORE3_MODES[match.group(1)]
 
         return(retMode)
         
@@ -1963,25 +2066,21 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
         boardNum = self.boardToDigit(board)+1
 
-        resp = {}
+        # the version does not change unless the board is reset or reconfigured
+        info = self._core3hInfoCache.setdefault(boardNum, {})
+        if "version" in info:
+            return (dict(info["version"]))
 
-        ret = self.sendCommand("core3h=%d,version" % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},version")
         # version
         # System name : FiLa10GS4+
         # Compiled on : Apr 18 2016 15:17:17
         # SW version  : 2.8.0-S4+
         # HW version  : 2.8-S4+
-        for line in ret.split("\n"):
-            tok = line.split(":")
-            if (len(tok) == 2):
-                if (tok[0].strip().startswith("System name")):
-                    resp["systemName"] = tok[1].strip()
-                elif (tok[0].strip().startswith("Compiled on")):
-                    resp["compileDate"] = tok[1].strip()
-                elif (tok[0].strip().startswith("SW version")):
-                    resp["versionSW"] = tok[1].strip()
-                elif (tok[0].strip().startswith("HW version")):
-                    resp["versionHW"] = tok[1].strip()
+        resp = {_CORE3H_VERSION_KEYS[match.group(1)]: match.group(2).strip() for match in _CORE3H_VERSION_RE.finditer(ret)}
+
+        if resp:
+            info["version"] = dict(resp)
             
         return (resp)
 
@@ -2008,7 +2107,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         resp = {}
 
-        ret = self.sendCommand("core3h=%d,sysstat" % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},sysstat", cache=True)
         # sysstat
 
         # System status:
@@ -2037,16 +2136,12 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         # Ethernet ARPs       : off (during data transfer)
         # Selected VSI output : vsi1-2-3-4
         
-        for line in ret.split("\n"):
-            tok = line.strip().split(":",1)
-            if tok[0].startswith("Core3H") or tok[0].startswith("System status"):
+        for match in _SYSSTAT_LINE_RE.finditer(ret):
+            key, value = match.groups()
+            if key.startswith(("Core3H", "System status")):
                 continue
-        #    print (tok[0])
-            if len(tok) == 2:
-                # replace space by underscore, make lower case
-                key = (' '.join(tok[0].split())).replace(" ", "_",2).replace(".","").lower()
-                value = tok[1].strip()
-                resp[key] = value
+            # replace space by underscore, make lower case
+            resp[_labelToKey(key, 2)] = value.strip()
 
                 
         return (resp)
@@ -2063,7 +2158,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         board: the board number (starting at 0=A) or board ID (e.g "A")
         '''
         boardNum = self.boardToDigit(board)+1
-        return self.sendCommand("core3h=%d,sysstat_fs" % (boardNum))
+        return self.sendCommand(f"core3h={boardNum},sysstat_fs")
 
     def core3h_mode_fs(self, board):
         ''' 
@@ -2075,7 +2170,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         board: the board number (starting at 0=A) or board ID (e.g "A")
         '''
         boardNum = self.boardToDigit(board)+1
-        return self.sendCommand("core3h=%d,mode_fs" % (boardNum))
+        return self.sendCommand(f"core3h={boardNum},mode_fs")
 
         # mode_fs
         # vsi1,128000000/2,0xFFFFFFFF,vdif,2,16,1024
@@ -2090,7 +2185,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         board: the board number (starting at 0=A) or board ID (e.g "A")
         '''
         boardNum = self.boardToDigit(board)+1
-        return self.sendCommand("core3h=%d,status_fs" % (boardNum))
+        return self.sendCommand(f"core3h={boardNum},status_fs")
 
         # status_fs
         # synced,vdif,started
@@ -2110,19 +2205,22 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         '''
         boardNum = self.boardToDigit(board)+1
 
-        ret = self.sendCommand("core3h=%d,devices" % (boardNum))
-        #print ret
-        lines = ret.split("\n")
+        # the device map is fixed for the loaded firmware
+        info = self._core3hInfoCache.setdefault(boardNum, {})
+        if "devices" in info:
+            return (dict(info["devices"]))
+
+        ret = self.sendCommand(f"core3h={boardNum},devices")
+
         entry = {}
-        for line in lines:
-            line = line.strip()
-            tok = line.split("->")
-            if len(tok) == 2:
-                value = tok[0].strip()
-                if (value.isdigit()):
-                    value = int(value)
-                entry[tok[1].strip()] = value
+        for match in _DEVICES_RE.finditer(ret):
+            value = match.group(1)
+            if (value.isdigit()):
+                value = int(value)
+            entry[match.group(2)] = value
 
+        if entry:
+            info["devices"] = dict(entry)
 
         return (entry)
 
@@ -2143,8 +2241,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         self._validateSamplerNum(sampler)
 
-        bstats = []
-        ret = self.sendCommand("core3h=%s,core3_bstat %d" % (boardNum,sampler))
+        ret = self.sendCommand("core3h=%d,core3_bstat %d" % (boardNum,sampler), cache=True)
 
         if "not connected" in ret:
                 return(None)
@@ -2154,15 +2251,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
           #P("01") = 40.36% (25836378)
           #P("00") = 8.28% (5300386)
 
-        pattern = re.compile("\s*P\(\"(\d\d)\"\)\s*=\s*(\d+\.\d+)%\s+\((\d+)\)")
-        for line in ret.split('\n'):
-            #print (line)
-            match = pattern.match(line)
-            if (match):
-                #print (match.group(3))
-                bstats.append(int(match.group(3)))
-
-        return (bstats)
+        return ([int(match.group(3)) for match in _BSTAT_RE.finditer(ret)])
 
     def core3h_core3_power(self, board):
         '''
@@ -2177,8 +2266,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
 
         boardNum = self.boardToDigit(board) +1
 
-        pow = []
-        ret = self.sendCommand("core3h=%d,core3_power" % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},core3_power", cache=True)
 
         if "not connected" in ret:
                 return None
@@ -2188,14 +2276,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         #Power at sampler 1 = 99624764
         #Power at sampler 2 = 77772775
         #Power at sampler 3 = 110169325
-        pattern = re.compile("\s*Power\s+at\s+[Ss]ampler\s+(\d)\s+=\s+(\d+)")
-        for line in ret.split('\n'):
-#            print (line)
-            match = pattern.match(line)
-            if (match):
-                pow.append(int(match.group(2)))
-
-        return(pow)
+        return([int(match.group(2)) for match in _POWER_RE.finditer(ret)])
 
     def core3h_core3_corr(self, board):
         '''
@@ -2213,18 +2294,15 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
             list: List containing the three cross-correlation coefficients in the order described above
         '''
 
-        corr = [0] * 3 
+        corr = [0] * len(_CORR_PAIRS)
         boardNum = self.boardToDigit(board) +1
 
-        ret = self.sendCommand("core3h=%s,core3_corr" % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},core3_corr")
 
-        for line in ret.split("\n"):
-            if "0-1" in line:
-                corr[0] = int(line.split(":")[1].strip())
-            elif "1-2" in line:
-                corr[1] = int(line.split(":")[1].strip())
-            elif "2-3" in line:
-                corr[2] = int(line.split(":")[1].strip())
+        for match in _CORR_RE.finditer(ret):
+            idx = _CORR_PAIRS.get(match.group(1))
+            if idx is not None:
+                corr[idx] = int(match.group(2))
 
         return(corr)
 
@@ -2357,7 +2435,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if value < 0 or value>1023:
             raise ValueError("sampler delay value must be in the range 0-1023")
 
-        cmd = "adb3l=delay=%d,%d,%d" % (boardNum, sampler,value)
+        cmd = f"adb3l=delay={boardNum:d},{sampler:d},{int(value)}"
 
         self.sendCommand(cmd)
         return
@@ -2393,7 +2471,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if value < 0 or value>255:
             raise ValueError("sampler offset value must be in the range 0-255")
 
-        cmd = "adb3l=offset=%d,%d,%d" % (boardNum, sampler,value)
+        cmd = f"adb3l=offset={boardNum:d},{sampler:d},{int(value)}"
 
         self.sendCommand(cmd)
         return
@@ -2429,7 +2507,7 @@ class DBBC3CommandsetDefault(DBBC3Commandset):
         if value < 0 or value>255:
             raise ValueError("sampler gain value must be in the range 0-255")
 
-        cmd = "adb3l=gain=%d,%d,%d" % (boardNum, sampler,value)
+        cmd = f"adb3l=gain={boardNum:d},{sampler:d},{int(value)}"
 
         self.sendCommand(cmd)
         return
@@ -2450,7 +2528,7 @@ class DBBC3CommandsetStatic(object):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        cmd = "core3h=%d,sampler_power" % (boardNum)
+        cmd = f"core3h={boardNum},sampler_power"
 
         ret = self.sendCommand(cmd).lower()
 
@@ -2459,13 +2537,8 @@ class DBBC3CommandsetStatic(object):
         #power at sampler 2 = 104941019
         #power at sampler 3 = 113124549
 #
-        pattern = re.compile("\s*power\s+at\s+sampler\s+\d\s+=\s*(\d+)")
 
-        values=[]
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                values.append(int(match.group(1)))
+        values = [int(match.group(1)) for match in _SAMPLER_POWER_VALUE_RE.finditer(ret)]
 
         return (values)
 
@@ -2483,7 +2556,7 @@ class DBBC3CommandsetStatic(object):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        cmd = "core3h=%d,sampler_offset" % (boardNum)
+        cmd = f"core3h={boardNum},sampler_offset"
 
         ret = self.sendCommand(cmd).lower()
 
@@ -2492,13 +2565,8 @@ class DBBC3CommandsetStatic(object):
         #offset at sampler 2 = 64773646
         #offset at sampler 3 = 64186436
 
-        pattern = re.compile("\s*offset\s+at\s+sampler\s+\d\s+=\s*(\d+)")
 
-        values=[]
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                values.append(int(match.group(1)))
+        values = [int(match.group(1)) for match in _SAMPLER_OFFSET_VALUE_RE.finditer(ret)]
 
         return (values)
 
@@ -2516,7 +2584,7 @@ class DBBC3CommandsetStatic(object):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        cmd = "core3h=%d,sampler_delay" % (boardNum)
+        cmd = f"core3h={boardNum},sampler_delay"
 
         ret = self.sendCommand(cmd).lower()
 
@@ -2524,13 +2592,8 @@ class DBBC3CommandsetStatic(object):
         #Samplers 1-2: 145255624
         #Samplers 2-3: 134840264
 
-        pattern = re.compile("\s*samplers\s+\d\-\d:\s*(\d+)")
 
-        values=[]
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                values.append(int(match.group(1)))
+        values = [int(match.group(1)) for match in _SAMPLER_DELAY_VALUE_RE.finditer(ret)]
 
         return (values)
 
@@ -2558,7 +2621,7 @@ class DBBC3CommandsetStatic(object):
         '''
 
         boardNum = self.boardToDigit(board)+1
-        cmd = "core3h=%d,vdif_leapsecs" % (boardNum)
+        cmd = f"core3h={boardNum},vdif_leapsecs"
 
         if (secs):
             cmd += " %d" % secs
@@ -2566,12 +2629,10 @@ class DBBC3CommandsetStatic(object):
         ret = self.sendCommand(cmd)
 
         # Past leap seconds within reference epoch: 1
-        pattern = re.compile("^.*epoch:\s*(-*\d+)")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                return (int(match.group(1)))
+        match = _LEAPSECS_RE.search(ret)
+        if match:
+            return (int(match.group(1)))
 
         return(None)
 
@@ -2594,7 +2655,7 @@ class DBBC3CommandsetStatic(object):
 
         lines = []
 
-        for line in self.sendCommand(cmd).splitlines():
+        for line in ret.splitlines():
             if line != "":
                 lines.append(line)
 
@@ -2669,34 +2730,23 @@ class DBBC3CommandsetStatic(object):
 
             cmd += "=%d" % boardNum;
             # pps_delay[1]/ [1]: 43 ns, [5] 43 ns;
-            patStr = "pps_delay\[%d\]/" % boardNum
             numVals = int(self.config.maxBoardBBCs / 4)
             retVals = numVals
+            pattern = _ppsDelayPattern(boardNum, numVals)
         else:
             #pps_delay/ [1]: 39 ns, [2] 39 ns, [3] 0 ns, [4] 0 ns, [5] 0 ns, [6] 0 ns, [7] 0 ns, [8] 0 ns;
-            patStr = "pps_delay/"
-            numVals = 8
+            pattern = _ppsDelayPattern(None, 8)
             retVals = self.config.numCoreBoards
 
         ret = self.sendCommand(cmd)
 
-        for i in range(numVals):
-                patStr += "\s+\[(\d+)\]:{0,1}\s+(\d+)\s+ns,"
-        patStr = patStr[:-1] + ";"
-        pattern = re.compile(patStr)
-
         delays = []
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                for i in range(retVals):
-                    # convert into signed
-                    delay = int(match.group(2+i*2))
-                    # account for negative delays
-                    if delay > 500000000:
-                        delay = int(match.group(2+i*2)) - 1000000000
-                    delays.append(delay)
-        return(delays)
+        for match in pattern.finditer(ret):
+            # every second group holds a delay value
+            delays.extend(map(int, match.groups()[1:2*retVals:2]))
+
+        # account for negative delays
+        return([delay - 1000000000 if delay > 500000000 else delay for delay in delays])
 
     @staticmethod
     def checkphaseV2(self, board=None):
@@ -2740,11 +2790,8 @@ class DBBC3CommandsetStatic(object):
         resp = []
         ret = self.sendCommand("time")
 
-        pattern = re.compile("\s*Board\[(\d)\]\s*:\s*Epoch:\s*(\d+),\s*Second:\s*(\d+)")
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                resp.append({"epoch": match.group(2), "second": match.group(3)})
+        for match in _BOARD_EPOCH_RE.finditer(ret):
+            resp.append({"epoch": match.group(2), "second": match.group(3)})
 
         if not resp:
             raise DBBC3Exception("time: Did not receive any time information")
@@ -2784,13 +2831,9 @@ class DBBC3CommandsetStatic(object):
         cmd = "samplerstats=%d" % (boardNum)
         ret = self.sendCommand(cmd)
 
-        pattern = {}
-        pattern["power"] = re.compile("\s*Sampler\s*(\d)\s*:\s*(\d+)\[(.*)\]")
-        pattern["offset"] = re.compile("\s*Sampler\s*(\d)\s*:\s*(\d+)\s+(\d+\.\d+)\%\[(.*)\]")
-        pattern["delay"] = re.compile("\s*Sampler\s*(\d\-\d)\s*:\s*(\d+)\[(.*)\]")
 
         parse = ""
-        for line in ret.split("\n"):
+        for line in ret.splitlines():
             if "Power" in line:
                 parse = "power"
                 stats["power"] = {}
@@ -2813,7 +2856,7 @@ class DBBC3CommandsetStatic(object):
             if parse == "":
                 continue
             else:
-                match = pattern[parse].match(line)
+                match = _SAMPLERSTATS_RE[parse].match(line)
                 if match:
                     if parse == "power" or parse == "delay":
                         stats[parse]["val"].append (int(match.group(2)))
@@ -2833,28 +2876,21 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
     from this class.
     '''
 
-#    def __init__(self, clas):
-#
-#        DBBC3CommandsetDefault.__init__(self,clas)
+    __slots__ = ()
 
+    # methods attached to the DBBC3 instance in all DDC modes
+    _METHOD_NAMES = (
+        "dbbc", "_dbbc", "dbbcgain",
+#        "dbbcstat",
+        "cont_cal", "dbbctp", "dsc_tp", "dsc_corr", "dsc_bstat",
+        "mag_thr", "pps_delay", "core3hread", "core3hwrite",
+    )
 
     def __init__(self, clas):
 
         DBBC3CommandsetDefault.__init__(self,clas)
 
-        clas.dbbc = types.MethodType (self.dbbc.__func__, clas)
-        clas._dbbc = types.MethodType (self._dbbc.__func__, clas)
-        clas.dbbcgain = types.MethodType (self.dbbcgain.__func__, clas)
-#        clas.dbbcstat = types.MethodType (self.dbbcstat.__func__, clas)
-        clas.cont_cal = types.MethodType (self.cont_cal.__func__, clas)
-        clas.dbbctp = types.MethodType (self.dbbctp.__func__, clas)
-        clas.dsc_tp = types.MethodType (self.dsc_tp.__func__, clas)
-        clas.dsc_corr = types.MethodType (self.dsc_corr.__func__, clas)
-        clas.dsc_bstat = types.MethodType (self.dsc_bstat.__func__, clas)
-        clas.mag_thr = types.MethodType (self.mag_thr.__func__, clas)
-        clas.pps_delay = types.MethodType (self.pps_delay.__func__, clas)
-        clas.core3hread = types.MethodType (self.core3hread.__func__, clas)
-        clas.core3hwrite = types.MethodType (self.core3hwrite.__func__, clas)
+        self._attachMethods(clas, DBBC3Commandset_DDC_Common._METHOD_NAMES)
 
     def pps_delay(self, board=None):
         '''
@@ -2883,34 +2919,23 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
             cmd += "=%d" % boardNum;
             # pps_delay[1]/ [1]: 43 ns, [5] 43 ns;
-            patStr = "pps_delay\[%d\]/" % boardNum
             numVals = int(self.config.maxBoardBBCs / 4)
             retVals = numVals
+            pattern = _ppsDelayPattern(boardNum, numVals)
         else:
             #pps_delay/ [1]: 39 ns, [2] 39 ns, [3] 0 ns, [4] 0 ns, [5] 0 ns, [6] 0 ns, [7] 0 ns, [8] 0 ns;
-            patStr = "pps_delay/"
-            numVals = 8
+            pattern = _ppsDelayPattern(None, 8)
             retVals = self.config.numCoreBoards
 
         ret = self.sendCommand(cmd)
 
-        for i in range(numVals):
-                patStr += "\s+\[(\d+)\]:{0,1}\s+(\d+)\s+ns,"
-        patStr = patStr[:-1] + ";"
-        pattern = re.compile(patStr)
-
         delays = []
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                for i in range(retVals):
-                    # convert into signed 
-                    delay = int(match.group(2+i*2))
-                    # account for negative delays
-                    if delay > 500000000:
-                        delay = int(match.group(2+i*2)) - 1000000000
-                    delays.append(delay)
-        return(delays)
+        for match in pattern.finditer(ret):
+            # every second group holds a delay value
+            delays.extend(map(int, match.groups()[1:2*retVals:2]))
+
+        # account for negative delays
+        return([delay - 1000000000 if delay > 500000000 else delay for delay in delays])
 
     def dbbctp0 (self, bbc, tp0=None):
         '''
@@ -2939,12 +2964,10 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
         # dbbctp0/ all,10;
         # dbbctp0/ 1,10;
-        pattern = re.compile("dbbctp0\/\s*(.+?),(\d+);")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if (match):
-                return match.group(2)
+        match = _DBBCTP0_RE.search(ret)
+        if (match):
+            return match.group(2)
 
         return(None)
 
@@ -2989,13 +3012,11 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
         # dbbctdiode/ all,20,30;
         # dbbctdiode/ 1,20,30;
-        pattern = re.compile("dbbctdiode\/\s*(.+?),(\d+),(\d+);")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if (match):
-                return match.group(2), match.group(3)
-            
+        match = _DBBCTDIODE_RE.search(ret)
+        if (match):
+            return match.group(2), match.group(3)
+
         return(None)
 
 
@@ -3042,13 +3063,11 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
         # dbbcdpfu/ all,20,30;
         # dbbcdpfu/ 1,20,30;
-        pattern = re.compile("dbbcdpfu\/\s*(.+?),(\d+),(\d+);")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if (match):
-                return match.group(2), match.group(3)
-            
+        match = _DBBCDPFU_RE.search(ret)
+        if (match):
+            return match.group(2), match.group(3)
+
         return(None)
     
         
@@ -3112,45 +3131,43 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
         if (ifLabel):
             ifLabel = ifLabel.lower()
-            if (ifLabel not in str("abcdefgh")):
+            if (ifLabel not in _VALID_IF_LABELS):
                 raise ValueError("dbbc: ifLabel must be one of abcdefgh")
 
-        cmd = "dbbc{:02d}".format(bbc)
+        parts = [f"dbbc{bbc:02d}"]
 
         if (freq):
             self._validateBBCFreq(freq)
             
-            cmd += "=%f" %(freq)
+            parts.append(f"={freq:f}")
 
             if (bw):
                 # bw cannot be set with empty ifLabel due to control software parameter order
                 if not ifLabel:
                     ifLabel = 'a'
-                cmd += ",%s,%d" % (ifLabel,bw)
+                parts.append(f",{ifLabel},{int(bw)}")
 
                 if (tpint):
                     self._validateTPInt(tpint)
-                    cmd += ",%d" % (tpint)
+                    parts.append(f",{int(tpint)}")
 
+        cmd = "".join(parts)
         ret = self.sendCommand(cmd)
 
         #  dbbc001/ 2992.000000,a,32,1,agc,142,123,14855,14753,14866,14749;
-        pattern = re.compile("dbbc{:03d}\/\s*(\d+\.\d+),(.?),(\d+),(\d+),(.+?),(\d+),(\d+),(\d+),(\d+),(\d+),(\d+);".format(bbc))
-
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if (match):
-                resp['freq'] = match.group(1)
-                resp['ifLabel'] = match.group(2)
-                resp['bw'] = match.group(3)
-                resp['tpint'] = match.group(4)
-                resp['mode'] = match.group(5)
-                resp['gainUSB'] = match.group(6)
-                resp['gainLSB'] = match.group(7)
-                resp['tpUSBOn'] = match.group(8)
-                resp['tpLSBOn'] = match.group(9)
-                resp['tpUSBOff'] = match.group(10)
-                resp['tpLSBOff'] = match.group(11)
+
+        for match in _dbbcPattern(bbc).finditer(ret):
+            resp['freq'] = match.group(1)
+            resp['ifLabel'] = match.group(2)
+            resp['bw'] = match.group(3)
+            resp['tpint'] = match.group(4)
+            resp['mode'] = match.group(5)
+            resp['gainUSB'] = match.group(6)
+            resp['gainLSB'] = match.group(7)
+            resp['tpUSBOn'] = match.group(8)
+            resp['tpLSBOn'] = match.group(9)
+            resp['tpUSBOff'] = match.group(10)
+            resp['tpLSBOff'] = match.group(11)
 
         return(resp)
 
@@ -3194,9 +3211,9 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
         if (bbc != "all"):
             self._validateBBC(bbc)
-            cmd = "dbbcgain=%d" % (bbc)
+            parts = [f"dbbcgain={int(bbc)}"]
         else:
-            cmd = "dbbcgain=all"
+            parts = ["dbbcgain=all"]
             raise ValueError("dbbcgain: bbc=all is currently not supported")
 
         if (target):
@@ -3221,37 +3238,28 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
                 raise ValueError("dbbcgain: mode must be one of " + str(validModes))
 
             if (mode == "agc"):
-                cmd += ",agc" 
+                parts.append(",agc")
                 if (target):
-                    cmd += ",%d" % target
+                    parts.append(f",{target:d}")
             elif (mode == "man"):
                 if (gainU):
-                    cmd += ",%d" % int(gainU)
+                    parts.append(f",{gainU:d}")
                     if (gainL):
-                     cmd += ",%d" % int(gainL)
+                        parts.append(f",{gainL:d}")
                 else:
-                    cmd += ",man"
+                    parts.append(",man")
 
-        ret = self.sendCommand(cmd)
+        cmd = "".join(parts)
+        ret = self.sendCommand(cmd, cache=(not mode))
 
-        if ("agc" in ret):
-            # dbbcgain/ 1,83,74,agc,15000;
-            patStr = "dbbcgain\/\s+(.+),(\d+),(\d+),(.+),(\d+);" 
-        else:
-            # dbbcgain/ 1,83,74,man;
-            patStr = "dbbcgain\/\s+(.+),(\d+),(\d+),(.+);" 
-            
-        pattern = re.compile(patStr)
-    
-        for line in ret.split("\n"):
-                match = pattern.match(line)
-                if match:
-                    resp['bbc'] = int(match.group(1))
-                    resp['gainUSB'] = int(match.group(2))
-                    resp['gainLSB'] = int(match.group(3))
-                    resp['mode'] = match.group(4)
-                    if (match.group(4) == "agc"):
-                        resp['target'] = int(match.group(5))
+        match = _DBBCGAIN_RE.search(ret)
+        if match:
+            resp['bbc'] = int(match.group(1))
+            resp['gainUSB'] = int(match.group(2))
+            resp['gainLSB'] = int(match.group(3))
+            resp['mode'] = match.group(4)
+            if (match.group(4) == "agc" and match.group(5)):
+                resp['target'] = int(match.group(5))
 
         return(resp)
 
@@ -3287,17 +3295,13 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
         resp = {}
 
-        # Received from DBBC: dbbcstat/ 16,S,34.67,34.53;
-        pattern = re.compile("dbbcstat\/\s+(\d+),([SM]),(\d+\.\d+),(\d+\.\d+);")
+        # the control software answers one command per request, so
+        # collect the sign and magnitude replies and parse them in one go
+        ret = "".join([self.sendCommand("dbbcstat=%d,%s" % (bbc, mode), cache=True) for mode in ("s", "m")])
 
-        for mode in ["s", "m"]:
-            cmd = "dbbcstat=%d,%s" % (bbc, mode)
-            ret = self.sendCommand(cmd)
-
-            for line in ret.split("\n"):
-                match = pattern.match(line)
-                if match:
-                    resp[mode] = (float(match.group(3)), float(match.group(4)))
+        # Received from DBBC: dbbcstat/ 16,S,34.67,34.53;
+        for match in _DBBCSTAT_RE.finditer(ret):
+            resp[match.group(2).lower()] = (float(match.group(3)), float(match.group(4)))
                 
         return(resp)
 
@@ -3366,15 +3370,12 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
 
         # cont_cal/ off,0,80,0; 
-        pattern = re.compile("cont_cal\/\s+(.+?),(\d),(\d+),(\d);")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                resp["mode"] = match.group(1)
-                resp["polarity"] = int(match.group(2))
-                resp["freq"] = int(match.group(3))
-                resp["option"] = int(match.group(4))
+        for match in _CONT_CAL_RE.finditer(ret):
+            resp["mode"] = match.group(1)
+            resp["polarity"] = int(match.group(2))
+            resp["freq"] = int(match.group(3))
+            resp["option"] = int(match.group(4))
 
         return(resp)
 
@@ -3404,13 +3405,10 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
 
         #dbbctpd/ 0, 0, 0;
-        pattern = re.compile("%s\/\s*(\d+),\s*(\d+),\s*(\d+);" % (cmd))
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                resp = (match.group(1), match.group(2),match.group(3))
-                
+        for match in _dbbctpPattern(board).finditer(ret):
+            resp = (match.group(1), match.group(2),match.group(3))
+            
         return(resp)
 
     def dsc_tp(self, board):
@@ -3436,13 +3434,9 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
 
         values = []
         #TP[2][0] = 69948
-        patStr = "TP\[%d\]\[[0123]\]\s+=\s+(\d+)" % (board+1)
-        pattern = re.compile(patStr)
-
-        for line in ret.split("\n"):
-                match = pattern.match(line)
-                if match:
-                    values.append(int(match.group(1)))
+        for match in _DSC_TP_RE.finditer(ret):
+            if int(match.group(1)) == boardNum:
+                values.append(int(match.group(2)))
 
         return(values)
         
@@ -3477,19 +3471,16 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         cmd = "dsc_corr=%d" % (boardNum)
         ret = self.sendCommand(cmd)
 
-        corr = [0] * 3
+        corr = [0] * len(_CORR_PAIRS)
 
         # Correlation board 1:
         # [0-1]: 157322344
         # [1-2]: 155710069
         # [2-3]: 158944035;
-        for line in ret.split("\n"):
-            if "0-1" in line:
-                corr[0] = int(line.split(":")[1].strip())
-            elif "1-2" in line:
-                corr[1] = int(line.split(":")[1].strip())
-            elif "2-3" in line:
-                corr[2] = int(line.split(":")[1].strip().replace(";",""))
+        for match in _CORR_RE.finditer(ret):
+            idx = _CORR_PAIRS.get(match.group(1))
+            if idx is not None:
+                corr[idx] = int(match.group(2))
 
         return(corr)
 
@@ -3527,7 +3518,6 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         cmd = "dsc_bstat=%d, %d" % (boardNum, sampler)
         ret = self.sendCommand(cmd)
 
-        pattern = re.compile("\[(\d\d)\]\s*=\s*(\d+),\s*(\d+)\%")
         # dsc_bstat/
         # Bstat[1][1]:
         # [11] =   1454,   9%
@@ -3536,19 +3526,9 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         # [00] =   1420,   9%;
 
         stat = [0] * 4
-        for line in ret.split("\n"):
-            line = line.strip().replace(";","")
-            match = pattern.match(line)
-            if (match):
-#                print (line)
-                if (match.group(1) == "11"):
-                    stat[0] = {"count":int(match.group(2)), "perc":int(match.group(3))}
-                elif (match.group(1) == "10"):
-                    stat[1] = {"count":int(match.group(2)), "perc":int(match.group(3))}
-                elif (match.group(1) == "01"):
-                    stat[2] = {"count":int(match.group(2)), "perc":int(match.group(3))}
-                elif (match.group(1) == "00"):
-                    stat[3] = {"count":int(match.group(2)), "perc":int(match.group(3))}
+        for match in _DSC_BSTAT_RE.finditer(ret):
+            if match.group(1) in _BSTAT_IDX:
+                stat[_BSTAT_IDX[match.group(1)]] = {"count":int(match.group(2)), "perc":int(match.group(3))}
 
         return(stat)
 
@@ -3583,12 +3563,10 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
         # mag_thr/ 1,75.000000;
 
-        pattern = re.compile("mag_thr\/\s*(\d+),(\d+\.\d+)")
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                return(float(match.group(2)))
+        match = _MAG_THR_RE.search(ret)
+        if match:
+            return(float(match.group(2)))
 
         return(None)
 
@@ -3621,11 +3599,10 @@ class DBBC3Commandset_DDC_Common (DBBC3CommandsetDefault):
         ret = self.sendCommand(cmd)
 
         # core3hread/ Core3H[1],Block[1],BBC[5000],Reg[1] = 00000077;
-        pattern = re.compile("core3hread/.+?\s*=\s*(.+);")
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if (match):
-                value = hex(int(match.group(1),16))
+        match = _CORE3HREAD_RE.search(ret)
+        if (match):
+            # the register is reported as zero-padded hex digits
+            value = "0x" + (match.group(1).lstrip("0").lower() or "0")
 
         return(value)
 
@@ -3661,9 +3638,7 @@ class DBBC3Commandset_DDC_V_123(DBBC3Commandset_DDC_Common):
     DDC_V mode version 123
     '''
 
-    def __init__(self, clas):
-
-        DBBC3Commandset_DDC_Common.__init__(self,clas)
+    __slots__ = ()
 
     def dbbc (self, bbc, freq=None, ifLabel=None, tpint=None):
         ''' 
@@ -3695,6 +3670,8 @@ class DBBC3Commandset_DDC_V_123(DBBC3Commandset_DDC_Common):
 
 class DBBC3Commandset_DDC_V_124(DBBC3Commandset_DDC_V_123):
 
+    __slots__ = ()
+
     def __init__(self, clas):
 
         DBBC3Commandset_DDC_V_123.__init__(self,clas)
@@ -3709,13 +3686,16 @@ class DBBC3Commandset_DDC_V_124(DBBC3Commandset_DDC_V_123):
     
 class DBBC3Commandset_OCT_D_110(DBBC3CommandsetDefault):
 
+    __slots__ = ()
+
+    # methods attached to the DBBC3 instance in OCT_D mode
+    _METHOD_NAMES = ("tap", "tap2", "core3hstats")
+
     def __init__(self, clas):
 
         DBBC3CommandsetDefault.__init__(self,clas)
 
-        clas.tap = types.MethodType (self.tap.__func__, clas)
-        clas.tap2 = types.MethodType (self.tap2.__func__, clas)
-        clas.core3hstats = types.MethodType (self.core3hstats.__func__, clas)
+        self._attachMethods(clas, DBBC3Commandset_OCT_D_110._METHOD_NAMES)
         clas.core3h_vdif_leapsecs = types.MethodType (DBBC3CommandsetStatic.core3h_vdif_leapsecs, clas)
 
 
@@ -3745,12 +3725,9 @@ class DBBC3Commandset_OCT_D_110(DBBC3CommandsetDefault):
         cmd = "core3hstats=%d" % (boardNum)
         ret = self.sendCommand(cmd)
 
-        pattern = {}
-        pattern["power"] = re.compile("\s*Filter\s*(\d)\s*:\s*(\d+)")
-        pattern["bstat"] = re.compile("\s*(\d{2})\s*:\s*(\d+)\s+(\d+\.\d+)\%")
 
         parse = ""
-        for line in ret.split("\n"):
+        for line in ret.splitlines():
             if "Power" in line:
                 parse = "power"
                 continue
@@ -3771,7 +3748,7 @@ class DBBC3Commandset_OCT_D_110(DBBC3CommandsetDefault):
             if parse == "":
                 continue
             else:
-                match = pattern[parse].match(line)
+                match = _CORE3HSTATS_RE[parse].match(line)
                 if match:
                     if parse == "power":
                         stats["filter%s" % (match.group(1))]["power"] = int(match.group(2))
@@ -3790,7 +3767,7 @@ class DBBC3Commandset_OCT_D_110(DBBC3CommandsetDefault):
         scaling: should always be one (default =1)
         '''
 
-        return self.sendCommand("tap2=%d,%s,%d" % (boardNum, filterFile,scaling))
+        return self.sendCommand(f"tap2={int(boardNum)},{filterFile},{int(scaling)}")
 
     def tap(self, boardNum, filterFile, scaling=1):
         '''
@@ -3802,10 +3779,12 @@ class DBBC3Commandset_OCT_D_110(DBBC3CommandsetDefault):
         scaling: should always be one (default =1)
         '''
 
-        return self.sendCommand("tap=%d,%s,%d" % (boardNum, filterFile,scaling))
+        return self.sendCommand(f"tap={int(boardNum)},{filterFile},{int(scaling)}")
 
 class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
 
+    __slots__ = ()
+
     def __init__(self, clas):
 
         DBBC3Commandset_OCT_D_110.__init__(self,clas)
@@ -3843,25 +3822,15 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         ret = self.sendCommand(cmd)
 
         #pps_delay/ [1]: 39 ns, [2] 39 ns, [3] 0 ns, [4] 0 ns, [5] 0 ns, [6] 0 ns, [7] 0 ns, [8] 0 ns;
-        patStr = "pps_delay/"
-        for i in range(8):
-                patStr += "\s+\[(\d+)\]:{0,1}\s+(\d+)\s+ns,"
-        patStr = patStr[:-1] + ";"
-        pattern = re.compile(patStr)
+        numBoards = self.config.numCoreBoards
 
         delays = []
+        for match in _ppsDelayPattern(None, 8).finditer(ret):
+            # every second group holds a delay value
+            delays.extend(map(int, match.groups()[1:2*numBoards:2]))
 
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                for i in range(self.config.numCoreBoards):
-                    # convert into signed
-                    delay = int(match.group(2+i*2))
-                    # account for negative delays
-                    if delay > 500000000:
-                        delay = int(match.group(2+i*2)) - 1000000000
-                    delays.append(delay)
-        return(delays)
+        # account for negative delays
+        return([delay - 1000000000 if delay > 500000000 else delay for delay in delays])
 
     def core3h_sampler_offset(self, board):
         '''
@@ -3888,18 +3857,14 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         # Offset at sampler 3 = 64170648
 
         res = [None] *4
-        ret = self.sendCommand("core3h=%d,sampler_offset"  % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},sampler_offset")
 
         if "not connected" in ret:
                 return(None)
 
-        pattern = re.compile("\s*Offset\s+at\s+sampler\s+(\d)\s*=\s*(\d+)")
 
-        for line in ret.split('\n'):
-            #print (line)
-            match = pattern.match(line)
-            if match:
-                res[int(match.group(1))] = int(match.group(2))
+        for match in _SAMPLER_OFFSET_RE.finditer(ret):
+            res[int(match.group(1))] = int(match.group(2))
 
         return (res)
 
@@ -3928,18 +3893,14 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         # Power at sampler 3 = 107536015
 
         res = [None] *4
-        ret = self.sendCommand("core3h=%d,sampler_power"  % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},sampler_power")
 
         if "not connected" in ret:
                 return(None)
 
-        pattern = re.compile("\s*Power\s+at\s+sampler\s+(\d)\s*=\s*(\d+)")
 
-        for line in ret.split('\n'):
-            #print (line)
-            match = pattern.match(line)
-            if match:
-                res[int(match.group(1))] = int(match.group(2))
+        for match in _SAMPLER_POWER_RE.finditer(ret):
+            res[int(match.group(1))] = int(match.group(2))
 
         return (res)
 
@@ -3966,7 +3927,7 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         boardNum = self.boardToDigit(board) +1
 
         pow = {}
-        ret = self.sendCommand("core3h=%d,core3_power" % (boardNum))
+        ret = self.sendCommand(f"core3h={boardNum},core3_power", cache=True)
 
         if "not connected" in ret:
                 return None
@@ -3977,13 +3938,8 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         #Power at filter 0b = 110171088
         #Power at filter 1b = 300520436
 
-        pattern = re.compile("\s*Power\s+at\s+filter\s+([01][ab])\s+=\s+(\d+)")
-        for line in ret.split('\n'):
-            #print (line)
-            match = pattern.match(line)
-            if (match):
-                #print (match.group(3))
-                pow[match.group(1)] = int(match.group(2))
+        for match in _FILTER_POWER_RE.finditer(ret):
+            pow[match.group(1)] = int(match.group(2))
 
         return(pow)
 
@@ -4007,8 +3963,7 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
 
         #self._validateSamplerNum(sampler)
 
-        bstats = []
-        ret = self.sendCommand("core3h=%d,core3_bstat %d" % (boardNum, filter))
+        ret = self.sendCommand("core3h=%d,core3_bstat %d" % (boardNum, filter), cache=True)
 
         if "not connected" in ret:
                 return(None)
@@ -4018,15 +3973,7 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
           #P("01") = 40.36% (25836378)
           #P("00") = 8.28% (5300386)
 
-        pattern = re.compile("\s*P\(\"(\d\d)\"\)\s*=\s*(\d+\.\d+)%\s+\((\d+)\)")
-        for line in ret.split('\n'):
-            #print (line)
-            match = pattern.match(line)
-            if (match):
-                #print (match.group(3))
-                bstats.append(int(match.group(3)))
-
-        return (bstats)
+        return ([int(match.group(3)) for match in _BSTAT_RE.finditer(ret)])
 
     def checkphase(self, board=None):
         '''
@@ -4078,12 +4025,9 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
         cmd = "core3hstats=%d" % (boardNum)
         ret = self.sendCommand(cmd)
 
-        pattern = {}
-        pattern["power"] = re.compile("\s*Filter\s*(\d)\s*:\s*(\d+)")
-        pattern["bstat"] = re.compile("\s*(\d{2})\s*:\s*(\d+)\s+(\d+\.\d+)\%")
 
         parse = ""
-        for line in ret.split("\n"):
+        for line in ret.splitlines():
             if "Power" in line:
                 parse = "power"
                 continue
@@ -4103,7 +4047,7 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
             if parse == "":
                 continue
             else:
-                match = pattern[parse].match(line)
+                match = _CORE3HSTATS_RE[parse].match(line)
                 if match:
                     if parse == "power": 
                         stats["filter%s" % (match.group(1))]["power"] = int(match.group(2))
@@ -4187,11 +4131,8 @@ class DBBC3Commandset_OCT_D_120(DBBC3Commandset_OCT_D_110):
             #Board[1], Filter 1 has file "[c:/DBBC_CONF/OCT_D_120/2000-4000_64taps.flt]" loaded
             #Board[1], Filter 2 has file "[c:/DBBC_CONF/OCT_D_120/0-2000_64taps.flt]" loaded;
             resp = {}
-            pattern = re.compile(".*Filter\s+(\d+)\s+has\s+file\s+\"\[(.+)\]\"\s+loaded")
-            for line in ret.split("\n"):
-                match = pattern.match(line)
-                if match:
-                    resp["filter%s_file" % (match.group(1))] = match.group(2)
+            for match in _TAP_FILE_RE.finditer(ret):
+                resp["filter%s_file" % (match.group(1))] = match.group(2)
             return (resp)
             
         else:
@@ -4209,6 +4150,8 @@ class DBBC3Commandset_DDC_U_125(DBBC3Commandset_DDC_Common):
     DDC_U mode version 125
     '''
 
+    __slots__ = ()
+
     def __init__(self, clas):
         '''
         '''
@@ -4226,10 +4169,8 @@ class DBBC3Commandset_DDC_U_126(DBBC3Commandset_DDC_U_125):
     DDC_U mode version 126
     '''
 
-    def __init__(self, clas):
-        '''
-        '''
-        DBBC3Commandset_DDC_U_125.__init__(self,clas)
+    __slots__ = ()
+
 
 class DBBC3Commandset_DDC_L_121(DBBC3Commandset_DDC_Common):
     '''
@@ -4237,10 +4178,7 @@ class DBBC3Commandset_DDC_L_121(DBBC3Commandset_DDC_Common):
     DDC_L mode version 121
     '''
 
-    def __init__(self, clas):
-        '''
-        '''
-        DBBC3Commandset_DDC_Common.__init__(self,clas)
+    __slots__ = ()
 
     def pps_delay(self):
         '''
@@ -4256,19 +4194,12 @@ class DBBC3Commandset_DDC_L_121(DBBC3Commandset_DDC_Common):
         ret = self.sendCommand(cmd)
 
         #pps_delay/ [1]: 39 ns, [2] 39 ns, [3] 0 ns, [4] 0 ns, [5] 0 ns, [6] 0 ns, [7] 0 ns, [8] 0 ns;
-        patStr = "pps_delay/"
-        for i in range(8):
-                patStr += "\s+\[(\d+)\]:{0,1}\s+(\d+)\s+ns,"
-        patStr = patStr[:-1] + ";"
-        pattern = re.compile(patStr)
+        numBoards = self.config.numCoreBoards
 
         delays = []
-        
-        for line in ret.split("\n"):
-            match = pattern.match(line)
-            if match:
-                for i in range(self.config.numCoreBoards):
-                    delays.append(int(match.group(2+i*2)))
+        for match in _ppsDelayPattern(None, 8).finditer(ret):
+            # every second group holds a delay value
+            delays.extend(map(int, match.groups()[1:2*numBoards:2]))
                 
         return(delays)
 
@@ -4279,6 +4210,8 @@ class DBBC3Commandset_DSC_110(DBBC3CommandsetDefault):
     DSC mode version 110
     '''
 
+    __slots__ = ()
+
     def __init__(self, clas):
         '''
         '''
@@ -4294,6 +4227,8 @@ class DBBC3Commandset_DSC_120(DBBC3CommandsetDefault):
     DSC mode version 120
     '''
 
+    __slots__ = ()
+
     def __init__(self, clas):
         '''
         '''
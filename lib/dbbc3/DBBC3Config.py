@@ -137,6 +137,11 @@ class DBBC3Config(object):
         """ int: The number of CORE3H boards installed in the DBBC3 """
         return self._numCoreBoards
 
+    @property
+    def numCore3hOutputs(self):
+        """ int: The maximum number of outputs of a Core3H board (e.g. for setting the output formats with core3h_start) """
+        return self._numCore3hOutputs
+
     @property
     def enableMulticast(self):
         """ boolean: True/False in case  multicast is enabled/disabled (depending on the mode)"""
@@ -31,6 +31,7 @@ import sys
 import importlib
 from datetime import datetime
 from abc import ABC, abstractmethod
+import dbbc3.DBBC3Util as d3u
 
 
 
@@ -317,7 +318,7 @@ class DBBC3MulticastBase(DBBC3MulticastAbstract):
 
         versionString = message[offset:offset+32].decode("utf-8").split(",")
         versionString[2] = versionString[2].replace(u'\x00', '')
-        amended = re.sub('\d+(st|nd|rd|th)', lambda m: m.group()[:-2].zfill(2), versionString[2])
+        amended = d3u.stripOrdinals(versionString[2])
 
         # DDC_V,124,November 07 2019
         self.message["mode"] = versionString[0]
@@ -28,6 +28,11 @@ import sys
 import re
 import subprocess
 
+# vdif time line of the core3h timesync response (after lowercasing and removing blanks)
+_VDIF_TIME_RE = re.compile(r"^\s*vdiftime:epoch=(\d+),secs=(\d+)", re.MULTILINE)
+# day number with ordinal suffix e.g. 18th
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)")
+
 
 def vdiftimeToUTC(epoch, seconds):
 
@@ -86,34 +91,10 @@ def parseTimeResponse(response):
     # Time synchronization succeeded!
 
     #vdiftime:epoch=47,secs=11806973
-    patVDIF = re.compile("vdiftime:epoch=(\d+),secs=(\d+)")
-
-    for line in response.split("\n"):
-
-        line = line.strip().lower().replace(" ","");
-
-        tok = line.split("=")
+    match = _VDIF_TIME_RE.search(response.lower().replace(" ",""))
 
-        match = patVDIF.match(line)
-
-        if (match):
-            timestamp = vdiftimeToUTC(int(match.group(1)), int(match.group(2)))
-         #   year = int(match.group(1)) // 2 + 2000
-         #   if (int(match.group(1)) % 2) == 0:
-         #       halfYearDays = 1
-         #   else:
-         #       halfYearDays = 182
-#
-#            doy = int(match.group(2)) // 86400 + halfYearDays
-
-#            remSecs = int(match.group(2)) - (doy - halfYearDays) * 86400
-#            hour = remSecs // 3600 
-#            minute = (remSecs - hour*3600) // 60
-#            second = (remSecs - hour*3600 - minute*60)
-            #print (year, halfYearDays, doy, hour, minute, second)
-
-#            timestamp = datetime.strptime("%s %s %s %s %s UTC" %(year, doy, hour, minute, second), "%Y %j %H %M %S %Z")
-            break
+    if (match):
+        timestamp = vdiftimeToUTC(int(match.group(1)), int(match.group(2)))
 
 #    print (val, timestamp)
     return(timestamp)
@@ -151,22 +132,22 @@ def parseTimeResponseLegacy(response):
         #seconds = 11790442
         #daysSince2000 = 8582
 
-        line = line.strip()
-        tok = line.split("=")
+        key, sep, value = line.partition("=")
+        key = key.strip()
 
-        if tok[0].strip() == "halfYearsSince2000":
-            year = int(tok[1]) // 2 + 2000
+        if key == "halfYearsSince2000":
+            year = int(value) // 2 + 2000
             if (year % 2) == 0:
                 halfYearDays = 1
             else:
                 halfYearDays = 182
 
-        elif tok[0].strip() == "seconds":
+        elif key == "seconds":
             # seconds are relative to VDIF epoch start
-            seconds = int(tok[1])
+            seconds = int(value)
 
             doy = seconds // 86400 + halfYearDays
-            remSecs = int(tok[1]) - (doy - halfYearDays) * 86400
+            remSecs = seconds - (doy - halfYearDays) * 86400
             hour = remSecs // 3600
             minute = (remSecs - hour*3600) // 60
             second = (remSecs - hour*3600 - minute*60)
@@ -178,6 +159,24 @@ def parseTimeResponseLegacy(response):
 
     return(timestamp)
 
+def _zeroPadDay(match):
+    return match.group(1).zfill(2)
+
+def stripOrdinals(dateString):
+    '''
+    Removes the ordinal suffixes (st, nd, rd, th) from the day numbers of a date string
+
+    Single digit day numbers are zero padded e.g. "February 1st 2020" becomes "February 01 2020"
+
+    Args:
+        dateString (str): the date string as reported in the version information of the DBBC3
+
+    Returns:
+        str: the date string without ordinal suffixes
+    '''
+
+    return _ORDINAL_RE.sub(_zeroPadDay, dateString)
+
 def validateOnOff(string):
     '''
     Validates the argument to be "on" or "off"